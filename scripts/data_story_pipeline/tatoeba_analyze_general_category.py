@@ -331,8 +331,13 @@ def analyze_general_sentences_round2(round1_analysis: Dict, general_sentences: L
     """
     print("ANALYSIS ROUND 2: Re-categorization by priority (lowest count first)...")
 
-    # Start with all sentences
-    remaining_sentences = list(general_sentences)
+    # Semantic matches do not depend on the category being processed, so
+    # match each sentence once up front instead of once per category
+    remaining = []
+    for sentence in general_sentences:
+        matches = assign_semantic_categories(sentence["spanish"])
+        remaining.append((sentence, matches[0] if matches else None))
+
     round2_matches = defaultdict(list)
     round2_sentences_by_category = defaultdict(list)
 
@@ -348,27 +353,24 @@ def analyze_general_sentences_round2(round1_analysis: Dict, general_sentences: L
     for category_id, _ in categories_by_count:
         category_matches = []
 
-        # Process remaining sentences
-        newly_categorized = []
-        for sentence in remaining_sentences:
-            matches = assign_semantic_categories(sentence["spanish"])
-
-            if matches and matches[0][0] == category_id:
-                matched_by = matches[0][1]
+        # Process remaining sentences, keeping the uncategorized ones for later categories
+        still_remaining = []
+        for sentence, top_match in remaining:
+            if top_match and top_match[0] == category_id:
                 category_matches.append({
                     "spanish": sentence["spanish"],
-                    "matched_by": matched_by
+                    "matched_by": top_match[1]
                 })
                 round2_sentences_by_category[category_id].append(sentence)
-                newly_categorized.append(sentence)
-
-        # Remove categorized sentences from remaining pool
-        for sentence in newly_categorized:
-            remaining_sentences.remove(sentence)
+            else:
+                still_remaining.append((sentence, top_match))
+        remaining = still_remaining
 
         if category_matches:
             round2_matches[category_id] = category_matches
 
+    remaining_sentences = [sentence for sentence, _ in remaining]
+
     # Calculate statistics
     total_general = len(general_sentences)
     categorized_general = sum(len(v) for v in round2_sentences_by_category.values())
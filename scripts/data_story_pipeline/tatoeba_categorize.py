@@ -11,8 +11,11 @@ License: CC-BY 2.0 FR
 """
 
 import json
+import os
 import yaml
 import re
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -33,8 +36,11 @@ OUTPUT_REPORT = REPORTS_DIR / "tatoeba-categorization-report.txt"
 # Maximum file size in bytes (500KB)
 MAX_FILE_SIZE = 500 * 1024
 
+# Number of sentences handed to a worker process per task
+CATEGORIZE_CHUNK_SIZE = 10_000
 
-@dataclass
+
+@dataclass(slots=True)
 class Sentence:
     """Represents a categorized sentence."""
     id: str
@@ -134,6 +140,48 @@ def assign_categories(sentence_text: str, categories: List[Category]) -> List[st
     return matched_categories
 
 
+# Category configuration for worker processes, set once per worker by _init_worker
+_worker_categories: List[Category] = []
+
+
+def _init_worker(categories: List[Category]):
+    """Store the category configuration in a worker process."""
+    global _worker_categories
+    _worker_categories = categories
+
+
+def _categorize_chunk(texts: List[str]) -> List[List[str]]:
+    """Assign categories to a chunk of Spanish texts inside a worker process."""
+    return [assign_categories(text, _worker_categories) for text in texts]
+
+
+def categorize_texts(texts: List[str], categories: List[Category]) -> List[List[str]]:
+    """Assign categories to many sentences, using all CPU cores for large inputs.
+
+    Args:
+        texts: Spanish texts to categorize
+        categories: List of category configurations
+
+    Returns:
+        List of category ID lists, in the same order as texts
+    """
+    if len(texts) <= CATEGORIZE_CHUNK_SIZE or (os.cpu_count() or 1) < 2:
+        return [assign_categories(text, categories) for text in texts]
+
+    chunks = [
+        texts[i:i + CATEGORIZE_CHUNK_SIZE]
+        for i in range(0, len(texts), CATEGORIZE_CHUNK_SIZE)
+    ]
+
+    # Categories are pickled once per worker via the initializer, not per task.
+    # Pool.imap keeps chunk results in input order.
+    results = []
+    with Pool(initializer=_init_worker, initargs=(categories,)) as pool:
+        for chunk_result in pool.imap(_categorize_chunk, chunks):
+            results.extend(chunk_result)
+    return results
+
+
 def convert_to_sentence_objects(raw_sentences: List[Dict], categories: List[Category]) -> List[Sentence]:
     """Convert raw sentence dictionaries to Sentence objects with categories.
 
@@ -147,12 +195,13 @@ def convert_to_sentence_objects(raw_sentences: List[Dict], categories: List[Cate
     print("Converting and categorizing sentences...")
     sentences = []
 
-    for raw in raw_sentences:
-        # Calculate word count
-        word_count = len(raw["spa"].split())
+    # Work column-wise over the Spanish texts: word counts via map() run the
+    # split/len loop in C instead of one Python-level call per sentence
+    spanish_texts = [raw["spa"] for raw in raw_sentences]
+    word_counts = list(map(len, map(str.split, spanish_texts)))
+    all_categories = categorize_texts(spanish_texts, categories)
 
-        # Assign categories
-        assigned_categories = assign_categories(raw["spa"], categories)
+    for raw, word_count, assigned_categories in zip(raw_sentences, word_counts, all_categories):
         if not assigned_categories:
             assigned_categories = ["general"]
 
@@ -195,6 +244,11 @@ def group_by_category(sentences: List[Sentence], categories: List[Category]) ->
     return dict(groups)
 
 
+def encode_compact_json(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON without whitespace."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def write_output_files(groups: Dict[str, List[Sentence]], categories: List[Category]) -> List[str]:
     """Write sentence groups to static JSON files.
 
@@ -212,13 +266,6 @@ def write_output_files(groups: Dict[str, List[Sentence]], categories: List[Categ
     SVELTE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print(f"  Writing output files to: {SVELTE_OUTPUT_DIR}")
 
-    manifest = {
-        "categories": [],
-        "generatedAt": datetime.now().isoformat()
-    }
-
-    generated_files = []
-
     # Create category lookup for ordering
     category_by_id = {cat.id: cat for cat in categories}
 
@@ -228,6 +275,8 @@ def write_output_files(groups: Dict[str, List[Sentence]], categories: List[Categ
         key=lambda item: category_by_id.get(item[0], Category(item[0], 999, [])).priority
     )
 
+    # Pass 1: serialize every output file and its manifest entry in memory
+    outputs = []
     for category_id, sentences in sorted_categories:
         # Convert Sentence objects to dictionaries
         sentence_dicts = [
@@ -242,9 +291,8 @@ def write_output_files(groups: Dict[str, List[Sentence]], categories: List[Categ
             for s in sentences
         ]
 
-        # Serialize to JSON to check size
-        json_str = json.dumps(sentence_dicts, ensure_ascii=False, indent=2)
-        json_bytes = json_str.encode('utf-8')
+        # Serialize to compact JSON (category files are only read by the app)
+        json_bytes = encode_compact_json(sentence_dicts)
 
         # Check if we need to split the file
         if len(json_bytes) > MAX_FILE_SIZE:
@@ -258,46 +306,43 @@ def write_output_files(groups: Dict[str, List[Sentence]], categories: List[Categ
                 end_idx = min((part_num + 1) * sentences_per_part, len(sentence_dicts))
                 part_sentences = sentence_dicts[start_idx:end_idx]
 
-                # Write part file
-                part_filename = f"{category_id}-{part_num + 1}.json"
-                part_path = SVELTE_OUTPUT_DIR / part_filename
-                with open(part_path, 'w', encoding='utf-8') as f:
-                    json.dump(part_sentences, f, ensure_ascii=False, indent=2)
-
-                # Add to manifest
-                manifest["categories"].append({
+                entry = {
                     "id": f"{category_id}-{part_num + 1}",
                     "name": category_id,
                     "part": part_num + 1,
                     "count": len(part_sentences),
-                    "filename": part_filename
-                })
-
-                generated_files.append(part_filename)
-                print(f"    Written: {part_filename} ({len(part_sentences)} sentences)")
+                    "filename": f"{category_id}-{part_num + 1}.json"
+                }
+                outputs.append((entry, encode_compact_json(part_sentences)))
         else:
-            # Write single file
-            filename = f"{category_id}.json"
-            file_path = SVELTE_OUTPUT_DIR / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(sentence_dicts, f, ensure_ascii=False, indent=2)
-
-            # Add to manifest
-            manifest["categories"].append({
+            entry = {
                 "id": category_id,
                 "name": category_id,
                 "count": len(sentence_dicts),
-                "filename": filename
-            })
+                "filename": f"{category_id}.json"
+            }
+            outputs.append((entry, json_bytes))
 
-            generated_files.append(filename)
-            print(f"    Written: {filename} ({len(sentence_dicts)} sentences)")
+    # Pass 2: write all category files; file writes release the GIL, so threads overlap them
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(
+            lambda output: (SVELTE_OUTPUT_DIR / output[0]["filename"]).write_bytes(output[1]),
+            outputs
+        ))
 
-    # Write manifest file
+    for entry, _ in outputs:
+        print(f"    Written: {entry['filename']} ({entry['count']} sentences)")
+
+    # Build the manifest once and write it last
+    manifest = {
+        "categories": [entry for entry, _ in outputs],
+        "generatedAt": datetime.now().isoformat()
+    }
     manifest_path = SVELTE_OUTPUT_DIR / "index.json"
     with open(manifest_path, 'w', encoding='utf-8') as f:
         json.dump(manifest, f, ensure_ascii=False, indent=2)
 
+    generated_files = [entry["filename"] for entry, _ in outputs]
     generated_files.append("index.json")
     print(f"  Written manifest: {manifest_path}")
     print(f"  Total files written: {len(generated_files)}")
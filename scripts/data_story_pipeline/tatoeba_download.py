@@ -10,15 +10,16 @@ Data source: https://tatoeba.org
 License: CC-BY 2.0 FR
 """
 
-import csv
+import hashlib
 import json
+import mmap
 import os
 import tarfile
 import urllib.request
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 
 # Configuration
 BASE_URL = "https://downloads.tatoeba.org/exports/"
@@ -33,6 +34,9 @@ FILES = {
     "links": "links.tar.bz2",
 }
 
+# Read size for incremental checksum computation
+HASH_CHUNK_SIZE = 1024 * 1024
+
 # Language codes
 LANG_SPA = "spa"  # Spanish
 LANG_FIN = "fin"  # Finnish
@@ -50,14 +54,78 @@ class RawSentenceTriple:
     eng: str
 
 
+def checksum_path(path: Path) -> Path:
+    """Return the path of the .sha256 sidecar file for a data file."""
+    return path.with_name(path.name + ".sha256")
+
+
+def compute_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file incrementally."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_checksum(path: Path, digest: Optional[str] = None):
+    """Write the SHA-256 sidecar file for a data file.
+
+    The sidecar holds the digest followed by the file's size and mtime, so
+    an unchanged file can be verified without hashing it again.
+    """
+    if digest is None:
+        digest = compute_sha256(path)
+    st = path.stat()
+    checksum_path(path).write_text(
+        f"{digest} {st.st_size} {st.st_mtime_ns}\n", encoding="utf-8"
+    )
+
+
+def verify_checksum(path: Path) -> bool:
+    """Check that a data file exists and matches its SHA-256 sidecar file.
+
+    A file without a sidecar (cached before sidecars were written) is
+    trusted and gets one. When the size and mtime recorded in the sidecar
+    still match, the file is accepted without re-hashing; otherwise its
+    digest is recomputed and compared.
+    """
+    if not path.exists():
+        return False
+
+    sidecar = checksum_path(path)
+    if not sidecar.exists():
+        write_checksum(path)
+        return True
+
+    fields = sidecar.read_text(encoding="utf-8").split()
+    if not fields:
+        return False
+    expected = fields[0]
+
+    st = path.stat()
+    if fields[1:] == [str(st.st_size), str(st.st_mtime_ns)]:
+        return True
+
+    digest = compute_sha256(path)
+    if digest != expected:
+        return False
+    # Same content with new metadata (e.g. touched or copied): record it
+    write_checksum(path, digest)
+    return True
+
+
 def download_if_needed(filename: str) -> Path:
-    """Download a file from Tatoeba if it doesn't exist locally."""
+    """Download a file from Tatoeba unless a verified local copy exists."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     path = DATA_DIR / filename
 
-    if not path.exists():
+    if not verify_checksum(path):
         print(f"Downloading {filename}...")
-        urllib.request.urlretrieve(BASE_URL + filename, path)
+        partial_path = path.with_name(path.name + ".part")
+        urllib.request.urlretrieve(BASE_URL + filename, partial_path)
+        partial_path.replace(path)
+        write_checksum(path)
         print(f"  Saved to {path}")
     else:
         print(f"Using cached {filename}")
@@ -70,23 +138,41 @@ def extract_member(archive_path: Path, member_name: str) -> Path:
     print(f"Extracting {member_name} from {archive_path.name}...")
     with tarfile.open(archive_path, "r:bz2") as tar:
         tar.extract(member_name, path=DATA_DIR)
-    return DATA_DIR / member_name
+    member_path = DATA_DIR / member_name
+    write_checksum(member_path)
+    return member_path
+
+
+def iter_tsv_lines(path: Path):
+    """Yield raw byte lines of a tab-separated file using a memory map.
+
+    Lines are yielded without the trailing newline and are not decoded, so
+    callers can skip uninteresting rows before paying for UTF-8 decoding.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            readline = mm.readline
+            line = readline()
+            while line:
+                yield line.rstrip(b"\r\n")
+                line = readline()
 
 
 def load_sentences(sentences_path: Path) -> dict:
     """Load sentences for target languages."""
     print("Loading sentences...")
     sent_text = {}
-    lang_filter = {LANG_SPA, LANG_FIN, LANG_ENG}
+    lang_filter = {LANG_SPA.encode(), LANG_FIN.encode(), LANG_ENG.encode()}
 
-    with open(sentences_path, encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter="\t")
-        for row in reader:
-            if len(row) < 3:
-                continue
-            sid, lang, text = row[0], row[1], row[2]
-            if lang in lang_filter:
-                sent_text[sid] = (lang, text)
+    for line in iter_tsv_lines(sentences_path):
+        row = line.split(b"\t", 2)
+        if len(row) < 3:
+            continue
+        sid, lang, text = row
+        if lang in lang_filter:
+            sent_text[sid.decode("utf-8")] = (lang.decode("utf-8"), text.decode("utf-8"))
 
     print(f"  Loaded {len(sent_text)} sentences in spa/fin/eng")
     return sent_text
@@ -97,14 +183,13 @@ def load_links(links_path: Path) -> dict:
     print("Loading translation links...")
     neighbors = defaultdict(set)
 
-    with open(links_path, encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter="\t")
-        for row in reader:
-            if len(row) < 2:
-                continue
-            a, b = row[0], row[1]
-            neighbors[a].add(b)
-            neighbors[b].add(a)
+    for line in iter_tsv_lines(links_path):
+        row = line.split(b"\t", 2)
+        if len(row) < 2:
+            continue
+        a, b = row[0].decode("utf-8"), row[1].decode("utf-8")
+        neighbors[a].add(b)
+        neighbors[b].add(a)
 
     print(f"  Loaded links for {len(neighbors)} sentences")
     return neighbors
@@ -126,10 +211,10 @@ def load_raw_sentences() -> List[Dict]:
     sentences_csv = DATA_DIR / "sentences.csv"
     links_csv = DATA_DIR / "links.csv"
 
-    if not sentences_csv.exists():
+    if not verify_checksum(sentences_csv):
         extract_member(sentences_tar, "sentences.csv")
 
-    if not links_csv.exists():
+    if not verify_checksum(links_csv):
         extract_member(links_tar, "links.csv")
 
     # Process data
@@ -188,14 +273,13 @@ def deduplicate_sentences(sentences: List[Dict]) -> List[Dict]:
         Deduplicated list of sentence dictionaries
     """
     print("Deduplicating sentences...")
-    seen = set()
-    deduped = []
-
+    # Dicts keep insertion order, so setdefault keeps the first occurrence.
+    # Keys are references to the sentence strings already held in memory, so
+    # the index costs one pointer per sentence rather than a copy of the text.
+    by_spanish = {}
     for s in sentences:
-        key = s["spa"]
-        if key not in seen:
-            seen.add(key)
-            deduped.append(s)
+        by_spanish.setdefault(s["spa"], s)
+    deduped = list(by_spanish.values())
 
     duplicates_removed = len(sentences) - len(deduped)
     if duplicates_removed > 0:
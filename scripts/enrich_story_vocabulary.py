@@ -12,47 +12,97 @@ Usage:
     python scripts/enrich_story_vocabulary.py
 """
 
+import bisect
+import functools
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump(obj: Any, path: Path) -> None:
+    """Write obj as 2-space indented JSON plus trailing newline, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        path.write_bytes((json.dumps(obj, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
+
+
+# Accent stripping table for frequency lookups
+ACCENT_TABLE = str.maketrans({'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ñ': 'n'})
+
+_ARTICLE_RE = re.compile(r'^(el|la|los|las)\s+')
+_ADJ_RE = re.compile(r'/[ao]$')
+
+# Upper rank bound (inclusive) for each CEFR level; ranks above the last bound are C1
+_CEFR_THRESHOLDS = (500, 1000, 2000, 3500)
+_CEFR_LEVELS = ('A1', 'A2', 'B1', 'B2', 'C1')
+
+# Frequency map used by get_frequency_rank, set via set_frequency_map()
+_FREQ_MAP: Dict[str, int] = {}
+
 
 def load_frequency_data(frequency_file: Path) -> Dict[str, int]:
     """Load frequency data and return a dict mapping word -> rank."""
-    with open(frequency_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load(frequency_file)
     
-    freq_map = {}
-    words = data.get('words', {})
-    for word, info in words.items():
-        rank = info['rank']
-        freq_map[word.lower()] = rank
-    
-    return freq_map
+    # Pop the words so the rest of the document can be freed right away
+    words = data.pop('words', {})
+    del data
+    return {word.lower(): info['rank'] for word, info in words.items()}
+
+
+def set_frequency_map(freq_map: Dict[str, int]) -> None:
+    """Set the frequency map used for lookups and clear memoized results."""
+    global _FREQ_MAP
+    _FREQ_MAP = freq_map
+    normalize_spanish_word.cache_clear()
+    get_frequency_rank.cache_clear()
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_spanish_word(word: str) -> str:
     """Normalize Spanish word for frequency lookup."""
     # Remove articles (el, la, los, las)
-    word = re.sub(r'^(el|la|los|las)\s+', '', word.lower())
+    word = _ARTICLE_RE.sub('', word.lower())
     # Remove trailing adjective markers
-    word = re.sub(r'/[ao]$', '', word)
+    word = _ADJ_RE.sub('', word)
     return word.strip()
 
 
-def get_frequency_rank(spanish_word: str, freq_map: Dict[str, int]) -> Optional[int]:
-    """Get frequency rank for a Spanish word."""
+@functools.lru_cache(maxsize=16384)
+def get_frequency_rank(spanish_word: str) -> Optional[int]:
+    """Get frequency rank for a Spanish word from the current frequency map."""
+    freq_map = _FREQ_MAP
     normalized = normalize_spanish_word(spanish_word)
     
     # Try exact match first
     if normalized in freq_map:
         return freq_map[normalized]
     
-    # Try without accents
-    no_accents = normalized.replace('á', 'a').replace('é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u').replace('ñ', 'n')
-    if no_accents in freq_map:
-        return freq_map[no_accents]
+    # Try without accents (an ASCII-only word has none to strip)
+    if not normalized.isascii():
+        no_accents = normalized.translate(ACCENT_TABLE)
+        if no_accents in freq_map:
+            return freq_map[no_accents]
     
     # Try first word if it's a phrase
     if ' ' in normalized:
@@ -67,29 +117,24 @@ def rank_to_cefr(rank: Optional[int]) -> Optional[str]:
     """Map frequency rank to CEFR level."""
     if rank is None:
         return None
-    
-    if rank <= 500:
-        return 'A1'
-    elif rank <= 1000:
-        return 'A2'
-    elif rank <= 2000:
-        return 'B1'
-    elif rank <= 3500:
-        return 'B2'
-    else:
-        return 'C1'
+    return _CEFR_LEVELS[bisect.bisect_left(_CEFR_THRESHOLDS, rank)]
 
 
-def enrich_vocabulary(vocabulary: List[Dict[str, Any]], freq_map: Dict[str, int]) -> List[Dict[str, Any]]:
+def enrich_vocabulary(vocabulary: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Enrich vocabulary words with frequency data."""
     enriched = []
     
     for word in vocabulary:
+        # Keep words enriched by an earlier run as they are
+        if 'frequencyRank' in word:
+            enriched.append(word)
+            continue
+        
         enriched_word = word.copy()
         spanish = word['spanish']
         
         # Get frequency rank
-        rank = get_frequency_rank(spanish, freq_map)
+        rank = get_frequency_rank(spanish)
         if rank is not None:
             enriched_word['frequencyRank'] = rank
             enriched_word['cefrLevel'] = rank_to_cefr(rank)
@@ -99,21 +144,29 @@ def enrich_vocabulary(vocabulary: List[Dict[str, Any]], freq_map: Dict[str, int]
     return enriched
 
 
-def enrich_story_file(story_file: Path, freq_map: Dict[str, int]) -> bool:
-    """Enrich a single story file with frequency data."""
+def enrich_story_file(story_file: Path) -> bool:
+    """Enrich a single story file with frequency data.
+
+    Returns True if the file was updated, False if there was nothing to add.
+    """
     print(f"Processing {story_file.name}...")
     
     # Load story
-    with open(story_file, 'r', encoding='utf-8') as f:
-        story = json.load(f)
+    story = _load(story_file)
+    
+    # Skip stories whose vocabulary is already fully enriched
+    vocabulary = story.get('vocabulary', [])
+    if all('frequencyRank' in word for word in vocabulary):
+        return False
     
     # Enrich vocabulary
-    if 'vocabulary' in story:
-        story['vocabulary'] = enrich_vocabulary(story['vocabulary'], freq_map)
+    enriched = enrich_vocabulary(vocabulary)
+    if enriched == vocabulary:
+        return False
+    story['vocabulary'] = enriched
     
     # Write back
-    with open(story_file, 'w', encoding='utf-8') as f:
-        json.dump(story, f, ensure_ascii=False, indent='\t')
+    _dump(story, story_file)
     
     return True
 
@@ -134,6 +187,7 @@ def main():
     # Load frequency data
     print(f"Loading frequency data from {frequency_file}")
     freq_map = load_frequency_data(frequency_file)
+    set_frequency_map(freq_map)
     print(f"Loaded {len(freq_map)} frequency entries")
     
     # Process all story files
@@ -141,7 +195,11 @@ def main():
     for level_folder in ['a2', 'b1']:
         level_dir = stories_dir / level_folder
         if level_dir.exists():
-            story_files.extend(level_dir.glob('*.json'))
+            with os.scandir(level_dir) as entries:
+                story_files.extend(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                )
     
     if not story_files:
         print("No story files found")
@@ -149,13 +207,19 @@ def main():
     
     print(f"\nFound {len(story_files)} story files to process")
     
-    success_count = 0
-    for story_file in sorted(story_files):
-        if enrich_story_file(story_file, freq_map):
-            success_count += 1
+    # Each worker receives the frequency map once through the initializer and
+    # reads and writes its own story files, so file I/O overlaps with
+    # enrichment in the other workers
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=set_frequency_map,
+        initargs=(freq_map,),
+    ) as executor:
+        results = executor.map(enrich_story_file, sorted(story_files, key=str), chunksize=4)
+        updated_count = sum(1 for result in results if result)
     
     print(f"\n✅ Enrichment complete!")
-    print(f"   - {success_count}/{len(story_files)} stories enriched")
+    print(f"   - {updated_count}/{len(story_files)} stories updated")
     print(f"   - Vocabulary words now include frequencyRank and cefrLevel")
     
     return True
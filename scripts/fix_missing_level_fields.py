@@ -6,6 +6,31 @@ Reads manifest to get the correct level for each story and updates the story fil
 
 import json
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump(obj: Any, path: Path) -> None:
+    """Write obj as 2-space indented JSON plus trailing newline, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        path.write_bytes((json.dumps(obj, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
 
 
 def get_stories_dir() -> Path:
@@ -20,8 +45,7 @@ def load_manifest():
     stories_dir = get_stories_dir()
     manifest_file = stories_dir / 'manifest.json'
     
-    with open(manifest_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load(manifest_file)
 
 
 def fix_story_level_fields():
@@ -43,8 +67,7 @@ def fix_story_level_fields():
             continue
         
         # Load story
-        with open(story_file, 'r', encoding='utf-8') as f:
-            story_data = json.load(f)
+        story_data = _load(story_file)
         
         # Check if level field is missing or None
         if 'level' not in story_data or story_data['level'] is None:
@@ -52,8 +75,7 @@ def fix_story_level_fields():
             story_data['level'] = level
             
             # Write back
-            with open(story_file, 'w', encoding='utf-8') as f:
-                json.dump(story_data, f, ensure_ascii=False, indent=2)
+            _dump(story_data, story_file)
             
             fixed_count += 1
     
@@ -62,17 +84,14 @@ def fix_story_level_fields():
 
 def update_valid_categories():
     """Update VALID_CATEGORIES in test file to include all used categories."""
-    stories_dir = get_stories_dir()
     manifest = load_manifest()
     
-    categories = set()
-    for story_meta in manifest['stories']:
-        if 'category' in story_meta:
-            categories.add(story_meta['category'])
+    categories = {s['category'] for s in manifest['stories'] if 'category' in s}
+    sorted_categories = sorted(categories)
     
-    print(f"\n📋 All categories used: {sorted(categories)}")
+    print(f"\n📋 All categories used: {sorted_categories}")
     print(f"\nAdd these to VALID_CATEGORIES in test_story_data_integrity.py:")
-    print(f"VALID_CATEGORIES = {{{', '.join(repr(c) for c in sorted(categories))}}}")
+    print(f"VALID_CATEGORIES = {{{', '.join(repr(c) for c in sorted_categories)}}}")
 
 
 if __name__ == '__main__':
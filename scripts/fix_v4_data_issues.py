@@ -11,17 +11,29 @@ This script fixes data issues identified by validation scripts:
 After running this script, regenerate the manifest to sync metadata.
 """
 
+import contextlib
+import io
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Valid story categories according to StoryCategory type
-VALID_CATEGORIES = [
+VALID_CATEGORIES = frozenset((
     'cafe', 'culture', 'education', 'environment', 'everyday', 
     'family', 'food', 'health', 'home', 'housing', 'nature', 
     'shopping', 'social', 'technology', 'travel', 'work'
-]
+))
+
+# Sentinel for dict.pop() defaults, distinct from any stored value
+_MISSING = object()
 
 # Category mapping for invalid categories
 CATEGORY_MAPPING = {
@@ -42,31 +54,40 @@ CATEGORY_MAPPING = {
 
 def load_json_file(filepath: Path) -> Dict[str, Any]:
     """Load JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = filepath.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def save_json_file(filepath: Path, data: Dict[str, Any]) -> None:
-    """Save JSON file with pretty formatting."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write('\n')
+    """Save JSON file with pretty formatting.
+
+    The file is left untouched if it already has exactly this content.
+    """
+    if ORJSON_AVAILABLE:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        blob = (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+    
+    # Compare sizes first so differing files are usually detected without a read
+    if filepath.exists() and filepath.stat().st_size == len(blob) and filepath.read_bytes() == blob:
+        return
+    filepath.write_bytes(blob)
 
 
 def remove_difficulty_field(story: Dict[str, Any]) -> bool:
     """Remove legacy 'difficulty' field from story. Returns True if changed."""
-    if 'difficulty' in story:
-        del story['difficulty']
-        return True
-    return False
+    return story.pop('difficulty', _MISSING) is not _MISSING
 
 
 def fix_invalid_category(story: Dict[str, Any]) -> bool:
     """Fix invalid category. Returns True if changed."""
     category = story.get('category', '')
     if category not in VALID_CATEGORIES:
-        if category in CATEGORY_MAPPING:
-            story['category'] = CATEGORY_MAPPING[category]
+        mapped = CATEGORY_MAPPING.get(category)
+        if mapped is not None:
+            story['category'] = mapped
             return True
         else:
             # Unknown category, default to 'everyday'
@@ -83,15 +104,16 @@ def fix_question_options(story: Dict[str, Any]) -> bool:
     
     for i, question in enumerate(questions):
         options = question.get('options', [])
-        if len(options) != 4:
-            print(f"  WARNING: Question {i+1} has {len(options)} options (expected 4)")
+        option_count = len(options)
+        if option_count != 4:
+            print(f"  WARNING: Question {i+1} has {option_count} options (expected 4)")
             
-            if len(options) > 4:
+            if option_count > 4:
                 # Truncate to first 4 options
                 question['options'] = options[:4]
                 print(f"    → Truncated to first 4 options")
                 changed = True
-            elif len(options) < 4:
+            else:
                 # This is a more serious issue - we can't auto-fix this
                 print(f"    → ERROR: Cannot auto-fix (too few options)")
     
@@ -100,13 +122,10 @@ def fix_question_options(story: Dict[str, Any]) -> bool:
 
 def update_title_to_finnish(story: Dict[str, Any], manifest_titles: Dict[str, str]) -> bool:
     """Update story title to Finnish from manifest. Returns True if changed."""
-    story_id = story.get('id', '')
-    if story_id in manifest_titles:
-        finnish_title = manifest_titles[story_id]
-        current_title = story.get('title', '')
-        if current_title != finnish_title:
-            story['title'] = finnish_title
-            return True
+    finnish_title = manifest_titles.get(story.get('id', ''))
+    if finnish_title is not None and story.get('title', '') != finnish_title:
+        story['title'] = finnish_title
+        return True
     return False
 
 
@@ -154,6 +173,46 @@ def process_story_file(filepath: Path, manifest_titles: Dict[str, str], fix_titl
     return counts
 
 
+# Per-worker settings for parallel story processing, set by _init_worker
+_worker_manifest_titles: Dict[str, str] = {}
+_worker_fix_titles = False
+
+
+def _init_worker(manifest_titles: Dict[str, str], fix_titles: bool) -> None:
+    """Store shared settings in a worker process."""
+    global _worker_manifest_titles, _worker_fix_titles
+    _worker_manifest_titles = manifest_titles
+    _worker_fix_titles = fix_titles
+
+
+def _process_story_worker(filepath: Path) -> Tuple[Dict[str, int], str]:
+    """Process a story file in a worker, capturing its output.
+
+    Returns the fix counts and everything the fixes printed, so the main
+    process can print each file's messages together and in order.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        counts = process_story_file(filepath, _worker_manifest_titles, _worker_fix_titles)
+    return counts, output.getvalue()
+
+
+def find_story_files(stories_dir: Path) -> List[Path]:
+    """Find all story JSON files in the level subdirectories (a1, a2, b1)."""
+    story_files = []
+    for level_dir in ('a1', 'a2', 'b1'):
+        level_path = stories_dir / level_dir
+        if level_path.exists():
+            with os.scandir(level_path) as entries:
+                story_files.extend(sorted(
+                    (Path(entry.path) for entry in entries
+                     if entry.name.endswith('.json') and entry.is_file()),
+                    key=str
+                ))
+    
+    return story_files
+
+
 def load_manifest_titles(manifest_path: Path) -> Dict[str, str]:
     """Load Finnish titles from manifest."""
     titles = {}
@@ -210,17 +269,19 @@ def main():
     }
     
     # Find all story JSON files in subdirectories (a1, a2, b1)
-    story_files = []
-    for level_dir in ['a1', 'a2', 'b1']:
-        level_path = stories_dir / level_dir
-        if level_path.exists():
-            story_files.extend(sorted(level_path.glob('*.json')))
+    story_files = find_story_files(stories_dir)
+    
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(manifest_titles, fix_titles),
+    ) as executor:
+        results = list(executor.map(_process_story_worker, story_files, chunksize=4))
     
-    for filepath in story_files:
+    for filepath, (counts, output) in zip(story_files, results):
         story_id = filepath.stem
         print(f"Processing: {story_id}")
-        
-        counts = process_story_file(filepath, manifest_titles, fix_titles)
+        print(output, end='')
         
         total_counts['files_processed'] += 1
         total_counts['difficulty_removed'] += counts['difficulty_removed']
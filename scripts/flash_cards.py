@@ -3,12 +3,16 @@ import os
 import sys
 import csv
 import json
-import re
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-import httpx
-from jinja2 import Template
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # -------------------------------------------------
 # Ensure working directory = script directory
@@ -44,8 +48,7 @@ UA = "omw-home-flashcards/1.0"
 RANK_MAX = int(os.environ.get("RANK_MAX", "10000"))  # Allow less common words
 KEEP_MAX = int(os.environ.get("KEEP_MAX", "500"))   # Keep more words
 ALLOW_MULTIWORD = int(os.environ.get("ALLOW_MULTIWORD", "0"))
-
-WORD_RE = re.compile(r"^([^\s]+)\s+(\d+)\s*$")
+KEEP_INTERMEDIATE = int(os.environ.get("KEEP_INTERMEDIATE", "1"))  # Write step 3-5 JSON caches
 
 # -------------------------------------------------
 # Curated vocabulary lists with Finnish translations and secondary meanings
@@ -174,13 +177,34 @@ CONTENT_H = A4_H_MM - 2 * MARGIN_MM
 # Helpers
 # -------------------------------------------------
 def norm(w: str) -> str:
-    return w.strip().lower().replace("'", "'")
+    return w.strip().lower()
+
+# VOCABULARY flattened once at import: (category, normalized_es, fi, fi2)
+_FLAT_VOCAB: Tuple[Tuple[str, str, str, str], ...] = tuple(
+    (category, norm(es), fi, fi2 or "")
+    for category, words in VOCABULARY.items()
+    for es, fi, fi2 in words
+)
 
 def load_json(p: Path, default):
-    return json.loads(p.read_text(encoding="utf-8")) if p.exists() else default
+    if not p.exists():
+        return default
+    data = p.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 def save_json(p: Path, obj: any) -> None:
-    p.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+    if ORJSON_AVAILABLE:
+        p.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        p.write_bytes(json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8"))
+
+try:
+    from itertools import batched  # Python 3.12+
+except ImportError:
+    def batched(iterable, n):
+        it = iter(iterable)
+        while batch := tuple(islice(it, n)):
+            yield batch
 
 def is_ok_label(s: str) -> bool:
     if not s:
@@ -220,89 +244,97 @@ def step1_nltk():
 async def step2_freq():
     if F_FREQ_RAW.exists():
         return
+
+    import httpx
+
     async with httpx.AsyncClient(timeout=60, headers={"User-Agent": UA}) as client:
         r = await client.get(FREQ_URL)
         r.raise_for_status()
         F_FREQ_RAW.write_text(r.text, encoding="utf-8")
 
-def step3_freq_map():
+def step3_freq_map() -> Optional[Dict[str, Dict[str, int]]]:
+    """Build the frequency map. Returns None if the cached map file is used."""
     if F_FREQ_MAP.exists():
-        return
+        return None
     if not F_FREQ_RAW.exists():
         raise SystemExit("Missing frequency raw file.")
 
     rank = 0
     freq: Dict[str, Dict[str, int]] = {}
-    for line in F_FREQ_RAW.read_text(encoding="utf-8").splitlines():
-        m = WORD_RE.match(line)
-        if not m:
-            continue
-        rank += 1
-        w = norm(m.group(1))
-        c = int(m.group(2))
-        if w not in freq:
-            freq[w] = {"rank": rank, "count": c}
-
-    save_json(F_FREQ_MAP, freq)
+    # Lines are "<word> <count>"; read them lazily and split instead of using a regex.
+    # Lines with leading whitespace are rejected, as the old regex anchored the word
+    # at the start of the line.
+    # norm is bound to a local to skip the global lookup on every line.
+    _norm = norm
+    with F_FREQ_RAW.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line[:1].isspace():
+                continue
+            parts = line.split()
+            if len(parts) != 2:
+                continue
+            word, count = parts
+            if not count.isdecimal():
+                continue
+            rank += 1
+            w = _norm(word)
+            if w not in freq:
+                freq[w] = {"rank": rank, "count": int(count)}
+
+    if KEEP_INTERMEDIATE:
+        save_json(F_FREQ_MAP, freq)
+    return freq
 
 # -------------------------------------------------
-def step4_build_candidates():
-    """Build candidates from curated vocabulary list with Finnish translations"""
+def step4_build_candidates() -> Optional[List[dict]]:
+    """Build candidates from curated vocabulary list with Finnish translations.
+    Returns None if the cached candidates file is used."""
     if F_OMW.exists():
-        return
+        return None
 
-    # Flatten vocabulary into list with categories
-    candidates = []
-    for category, words in VOCABULARY.items():
-        for es, fi, fi2 in words:
-            candidates.append({
-                "category": category,
-                "es": norm(es),
-                "fi": fi,
-                "fi2": fi2 or "",
-            })
+    candidates = [
+        {"category": category, "es": es, "fi": fi, "fi2": fi2}
+        for category, es, fi, fi2 in _FLAT_VOCAB
+    ]
 
-    save_json(F_OMW, candidates)
+    if KEEP_INTERMEDIATE:
+        save_json(F_OMW, candidates)
+    return candidates
 
 # -------------------------------------------------
 # Step 5: Join with frequency data and filter
 # -------------------------------------------------
-def step5_join():
+def step5_join(items: Optional[List[dict]] = None,
+               freq: Optional[Dict[str, Dict[str, int]]] = None) -> Optional[List[dict]]:
+    """Join candidates with frequency ranks. Inputs not passed in are read
+    from the step 3/4 cache files. Returns None if the cached result is used."""
     if F_FINAL.exists():
-        return
+        return None
 
-    items = load_json(F_OMW, [])
-    freq = load_json(F_FREQ_MAP, {})
+    if items is None:
+        items = load_json(F_OMW, [])
+    if freq is None:
+        freq = load_json(F_FREQ_MAP, {})
 
     # Deduplicate by Spanish word (keep first occurrence)
-    seen_es = set()
-    joined = []
+    by_es = {}
     for it in items:
-        es = it["es"]
-        if es in seen_es:
-            continue
-        seen_es.add(es)
-        
+        by_es.setdefault(it["es"], it)
+
+    # Items are not reused, so the rank is added in place
+    for es, it in by_es.items():
         f = freq.get(es)
-        if f:
-            joined.append({
-                **it,
-                "rank": f["rank"],
-            })
-        else:
-            # Include words even without frequency data
-            joined.append({
-                **it,
-                "rank": 99999,  # Low priority
-            })
+        # Include words even without frequency data, with low priority
+        it["rank"] = f["rank"] if f else 99999
 
     # Sort by category first, then alphabetically by Spanish word
-    joined.sort(key=lambda x: (x["category"], x["es"]))
+    joined = sorted(by_es.values(), key=itemgetter("category", "es"))
     
     # Limit to 100 words
     filtered = joined[:100]
 
-    save_json(F_FINAL, filtered)
+    if KEEP_INTERMEDIATE:
+        save_json(F_FINAL, filtered)
 
     with F_CSV.open("w", encoding="utf-8", newline="") as f:
         w = csv.writer(f)
@@ -310,43 +342,45 @@ def step5_join():
         for r in filtered:
             w.writerow([r["category"], r["es"], r["fi"], r.get("fi2", ""), r.get("rank") or ""])
 
+    return filtered
+
 # -------------------------------------------------
 # Step 6: HTML output
 # -------------------------------------------------
-HTML = Template("""
+HTML_HEAD = f"""
 <!doctype html>
 <html>
 <head>
 <meta charset="utf-8">
 <style>
-@page { 
+@page {{ 
   size: A4; 
   margin: 0; 
-}
-@media print {
-  body { 
+}}
+@media print {{
+  body {{ 
     margin: 0; 
     padding: 0;
     -webkit-print-color-adjust: exact !important;
     print-color-adjust: exact !important;
-  }
-}
-body { 
+  }}
+}}
+body {{ 
   margin: 0; 
   font-family: Arial, sans-serif; 
-}
-.page {
+}}
+.page {{
   width: 210mm;
   height: 297mm;
-  padding: {{ margin }}mm;
+  padding: {MARGIN_MM}mm;
   box-sizing: border-box;
   display: grid;
-  grid-template-columns: repeat({{ cols }}, 1fr);
-  grid-template-rows: repeat({{ rows }}, 1fr);
-  gap: {{ gap }}mm;
+  grid-template-columns: repeat({COLS}, 1fr);
+  grid-template-rows: repeat({ROWS}, 1fr);
+  gap: {GAP_MM}mm;
   page-break-after: always;
-}
-.card {
+}}
+.card {{
   border: 0.5mm solid #333;
   border-radius: 2mm;
   padding: 1.5mm;
@@ -354,60 +388,72 @@ body {
   display: flex;
   flex-direction: column;
   justify-content: space-between;
-}
-.word { 
+}}
+.word {{ 
   font-weight: bold; 
   font-size: 4.5mm; 
   margin: 0.5mm 0;
   line-height: 1.2;
-}
-.meaning { 
+}}
+.meaning {{ 
   font-size: 3mm; 
   margin: 0.5mm 0;
   line-height: 1.2;
-}
-.meaning2 { 
+}}
+.meaning2 {{ 
   font-size: 2mm; 
   opacity: 0.7; 
   margin: 0.3mm 0; 
   font-style: italic;
   line-height: 1.2;
-}
-.small { 
+}}
+.small {{ 
   font-size: 1.8mm; 
   opacity: 0.7;
   line-height: 1.1;
-}
-.freq { 
+}}
+.freq {{ 
   font-size: 2mm; 
   font-weight: 600; 
   margin-top: 0.5mm;
   line-height: 1.1;
-}
+}}
 </style>
 </head>
 <body>
-{% for page in pages %}
-<div class="page">
-{% for c in page %}
-<div class="card" style="background-color: {{ c.color }};">
-<div class="small">{{ c.category }}</div>
-<div class="word">{{ c.es }}</div>
-<div class="meaning">{{ c.fi }}</div>
-{% if c.fi2 %}
-<div class="meaning2">{{ c.fi2 }}</div>
-{% endif %}
-<div class="freq">{{ c.freq }}</div>
-</div>
-{% endfor %}
-</div>
-{% endfor %}
-</body>
+"""
+
+HTML_TAIL = """</body>
 </html>
-""")
+"""
+
+CARD_FMT = """<div class="card" style="background-color: {color};">
+<div class="small">{category}</div>
+<div class="word">{es}</div>
+<div class="meaning">{fi}</div>
+{fi2_block}<div class="freq">{freq}</div>
+</div>
+"""
+
+FI2_FMT = """<div class="meaning2">{fi2}</div>
+"""
 
-def step6_html():
-    items = load_json(F_FINAL, [])
+_HEAD_BYTES = HTML_HEAD.encode("utf-8")
+_TAIL_BYTES = HTML_TAIL.encode("utf-8")
+
+def render_page(page: Tuple[dict, ...]) -> str:
+    cards = "".join(
+        CARD_FMT.format(fi2_block=FI2_FMT.format(fi2=c["fi2"]) if c["fi2"] else "", **c)
+        for c in page
+    )
+    return f'<div class="page">\n{cards}</div>\n'
+
+def step6_html(items: Optional[List[dict]] = None):
+    if items is None:
+        items = load_json(F_FINAL, [])
+    color_by_cat = {
+        cat: CATEGORY_COLORS.get(cat, "#FFFFFF") for cat in {r["category"] for r in items}
+    }
     cards = [{
         "es": r["es"],
         "fi": r["fi"],
@@ -415,33 +461,34 @@ def step6_html():
         "category": r["category"],
         "rank": r["rank"],
         "freq": freq_band(r["rank"]),
-        "color": CATEGORY_COLORS.get(r["category"], "#FFFFFF"),
+        "color": color_by_cat[r["category"]],
     } for r in items]
 
-    pages = [cards[i:i+PER_PAGE] for i in range(0, len(cards), PER_PAGE)]
-    out = HTML.render(
-        pages=pages,
-        cols=COLS,
-        rows=ROWS,
-        margin=MARGIN_MM,
-        gap=GAP_MM,
-    )
-    F_HTML.write_text(out, encoding="utf-8")
+    pages = list(batched(cards, PER_PAGE))
+    # Stream page by page instead of building the whole document as one string
+    with F_HTML.open("wb") as fh:
+        fh.write(_HEAD_BYTES)
+        for page in pages:
+            fh.write(render_page(page).encode("utf-8"))
+        fh.write(_TAIL_BYTES)
 
 # -------------------------------------------------
 # Main
 # -------------------------------------------------
 async def main():
     await step2_freq()
-    step3_freq_map()
-    step4_build_candidates()
-    step5_join()
-    step6_html()
+    # Results are passed along in memory; steps read cache files only for
+    # results that were not rebuilt in this run
+    freq = step3_freq_map()
+    candidates = step4_build_candidates()
+    final = step5_join(candidates, freq)
+    step6_html(final)
 
     print("Done. Files in ./data:")
     print(" - labels.html (print this)")
     print(" - labels.csv")
-    print(" - cached intermediate JSONs")
+    if KEEP_INTERMEDIATE:
+        print(" - cached intermediate JSONs")
 
 if __name__ == "__main__":
     import asyncio
@@ -10,49 +10,213 @@ Aggregates results from all validation scripts:
 - Manifest validation
 
 Outputs a markdown report with executive summary and detailed findings.
-Also generates CSV file with detailed issue information.
+Also generates CSV file with detailed issue information (written as a
+level-1 gzip file instead with --gzip).
 """
 
+import argparse
+import bisect
+import io
 import json
 import os
 import csv
+import gzip
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, TextIO, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).parent.parent
+REPORTS_DIR = PROJECT_ROOT / "reports"
+STORIES_FILE = PROJECT_ROOT / "svelte" / "static" / "stories" / "stories.json"
+
+# Summary line patterns for each validation report. Every alternative has
+# exactly one named group, so ``match.lastgroup`` names the field it sets and
+# a single finditer() pass over the report replaces the per-line if/elif chain.
+_STORY_RE = re.compile(
+    r"^(?:Total stories:\s*(?P<total_stories>\d+)"
+    r"|Stories with legacy 'difficulty' field:\s*(?P<legacy_difficulty>\d+)"
+    r"|Stories with invalid categories:\s*(?P<invalid_categories>\d+)"
+    r"|Stories with title mismatches:\s*(?P<title_mismatches>\d+)"
+    r"|Vocabulary count mismatches:\s*(?P<vocab_count_mismatches>\d+)"
+    r"|Question count mismatches:\s*(?P<question_count_mismatches>\d+)"
+    r"|Questions with non-standard option count:\s*(?P<question_structure_issues>\d+)"
+    r"|Total issues found:\s*(?P<total_issues>\d+))[ \t]*$",
+    re.MULTILINE,
+)
+
+_FREQUENCY_RE = re.compile(
+    r"^(?:Total words:\s*(?P<total_words>\d+)[ \t]*"
+    r"|Structure valid:\s*(?P<valid>\w+)[ \t]*"
+    r"|- (?P<warning>A1\+A2 levels only.*?)[- ]*)$",
+    re.MULTILINE,
+)
+
+_VOCABULARY_RE = re.compile(
+    r"^(?:Total categories:\s*(?P<total_categories>\d+)[ \t]*$"
+    r"|Total vocabulary words:\s*(?P<total_words>\d+)[ \t]*$"
+    r"|Words with learning tips:\s*(?P<words_with_tips>\d+)\s*/"
+    r"|Vocabulary words in frequency data:\s*(?P<words_in_frequency>\d+)\s*/"
+    r"|Vocabulary words NOT in frequency data:\s*(?P<words_not_in_frequency>\d+)[ \t]*$"
+    r"|Top 100 words in vocabulary:\s*(?P<top100_coverage>\d+)\s*/"
+    r"|Top 500 words in vocabulary:\s*(?P<top500_coverage>\d+)\s*/"
+    r"|Top 1000 words in vocabulary:\s*(?P<top1000_coverage>\d+)\s*/"
+    r"|Total words in multiple categories:\s*(?P<duplicate_words>\d+)[ \t]*$)",
+    re.MULTILINE,
+)
+
+_CROSSREF_RE = re.compile(
+    r"^(?:Total stories:\s*(?P<total_stories>\d+)"
+    r"|Total orphaned vocabulary words:\s*(?P<orphaned_vocab>\d+)"
+    r"|Total vocabulary words missing from database:\s*(?P<missing_from_db>\d+)"
+    r"|Total inconsistent translations:\s*(?P<inconsistent_translations>\d+))[ \t]*$",
+    re.MULTILINE,
+)
+
+_MANIFEST_RE = re.compile(
+    r"^(?:Stories in manifest:\s*(?P<stories_in_manifest>\d+)"
+    r"|Story files found:\s*(?P<story_files_found>\d+)"
+    r"|Manifest structure valid:\s*(?P<valid>\w+))[ \t]*$",
+    re.MULTILINE,
+)
+
+# Health score bands, lowest first: a score falls into band
+# bisect_right(_SCORE_THRESHOLDS, score), indexing the tables below.
+_SCORE_THRESHOLDS = (60, 75, 90)
+_STATUS_ICONS = ("🔴", "🟠", "🟡", "🟢")
+_PRIORITY_ACTIONS = (
+    "**Priority actions required:**\n"
+    "\n"
+    "1. Run individual validation scripts for detailed issue lists\n"
+    "2. Address high-priority issues (invalid categories, question structure)\n"
+    "3. Regenerate manifest after fixing story data\n"
+    "4. Add missing vocabulary to database\n"
+    "5. Standardize translations across all data sources\n"
+)
+# (status, executive summary, next steps) per band
+_HEALTH_STATUS = (
+    ("🔴 NEEDS ATTENTION", "Data has significant issues that require immediate attention.",
+     _PRIORITY_ACTIONS),
+    ("🟠 FAIR", "Data has several issues that should be addressed.",
+     _PRIORITY_ACTIONS),
+    ("🟡 GOOD", "Data is in good condition with some minor issues to address.",
+     "Address minor issues identified above to improve data quality.\n"),
+    ("🟢 EXCELLENT", "Data is in excellent condition with minimal issues.",
+     "Data quality is excellent. Continue monitoring with periodic validation runs.\n"),
+)
+
+
+# Markdown row tables: (label, issues key, unit) for the story issue
+# breakdown and (N, vocabulary key) for the top-N coverage rows.
+_STORY_ISSUE_ROWS = (
+    ("Legacy 'difficulty' field", "legacy_difficulty", "stories"),
+    ("Invalid categories", "invalid_categories", "stories"),
+    ("Title mismatches", "title_mismatches", "stories"),
+    ("Vocabulary count mismatches", "vocab_count_mismatches", "stories"),
+    ("Question count mismatches", "question_count_mismatches", "stories"),
+    ("Question structure issues", "question_structure_issues", "questions"),
+)
+_TOP_COVERAGE_ROWS = (
+    (100, "top100_coverage"),
+    (500, "top500_coverage"),
+    (1000, "top1000_coverage"),
+)
+
+# Health score deductions per issue: minor 0.3-0.5, medium 1, major 2-3.
+_STORY_ISSUE_WEIGHTS = (
+    ("legacy_difficulty", 0.5),
+    ("invalid_categories", 2),
+    ("title_mismatches", 0.3),
+    ("vocab_count_mismatches", 1),
+    ("question_count_mismatches", 1),
+    ("question_structure_issues", 3),
+)
+_CROSSREF_ISSUE_WEIGHTS = (
+    ("orphaned_vocab", 2),
+    ("missing_from_db", 1),
+    ("inconsistent_translations", 3),
+)
+
+
+# Most iovecs a single os.writev() call accepts. sysconf() reports -1 when
+# the system sets no limit, so fall back to a small safe batch then.
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+# Write buffer for the issues CSV; rows drain to disk in a few large write()
+# calls instead of one per default-sized (8 KiB) block.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _weighted_issue_count(counts: Dict[str, int], weights: Tuple[Tuple[str, float], ...]) -> float:
+    """Return the weighted sum of issue counts, i.e. the score deduction."""
+    return sum(counts[key] * weight for key, weight in weights)
+
+
+def _score_band(score: float) -> int:
+    """Return the index of the health band a 0-100 score falls into."""
+    return bisect.bisect_right(_SCORE_THRESHOLDS, score)
+
+
+def _read_if_exists(path: Path) -> Optional[str]:
+    """Read a report file, or return None if it has not been generated."""
+    try:
+        return path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
 
 
 def load_validation_results() -> Dict[str, Any]:
     """Load all validation result files."""
-    reports_dir = Path(__file__).parent.parent / "reports"
-    
     results = {
-        "story": reports_dir / "story-validation-results.txt",
-        "frequency": reports_dir / "frequency-validation-results.txt",
-        "vocabulary": reports_dir / "vocabulary-validation-results.txt",
-        "crossref": reports_dir / "story-vocabulary-crossref-results.txt",
-        "manifest": reports_dir / "manifest-validation-results.txt"
+        "story": REPORTS_DIR / "story-validation-results.txt",
+        "frequency": REPORTS_DIR / "frequency-validation-results.txt",
+        "vocabulary": REPORTS_DIR / "vocabulary-validation-results.txt",
+        "crossref": REPORTS_DIR / "story-vocabulary-crossref-results.txt",
+        "manifest": REPORTS_DIR / "manifest-validation-results.txt"
     }
     
-    loaded = {}
-    for key, path in results.items():
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                loaded[key] = f.read()
-        else:
-            loaded[key] = None
+    # The reports are independent files, so read them concurrently and let
+    # the disk latencies overlap instead of adding up.
+    with ThreadPoolExecutor(max_workers=len(results)) as executor:
+        futures = {key: executor.submit(_read_if_exists, path) for key, path in results.items()}
+        loaded = {key: future.result() for key, future in futures.items()}
     
     return loaded
 
 
 def load_stories() -> List[Dict]:
     """Load stories from JSON file."""
-    stories_file = Path(__file__).parent.parent / "svelte/static/stories/stories.json"
-    with open(stories_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # One unbuffered whole-file read; both parsers decode UTF-8 bytes directly.
+    raw = STORIES_FILE.read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
     return data.get('stories', [])
 
 
+def _collect_counts(pattern: "re.Pattern[str]", content: str, data: Dict[str, Any]) -> None:
+    """Store the integer captured by each match of ``pattern`` under its group name."""
+    # The summary lines sit near the top of the reports, so stop scanning
+    # once every field has been seen instead of walking the detail sections.
+    pending = set(pattern.groupindex)
+    for match in pattern.finditer(content):
+        key = match.lastgroup
+        data[key] = int(match[key])
+        pending.discard(key)
+        if not pending:
+            break
+
+
 def parse_story_validation(content: str) -> Dict[str, Any]:
     """Parse story validation results."""
     if not content:
@@ -68,25 +232,8 @@ def parse_story_validation(content: str) -> Dict[str, Any]:
         "total_issues": 0
     }
     
-    # Parse total stories
-    total_stories = 0
-    for line in content.split('\n'):
-        if line.startswith("Total stories:"):
-            total_stories = int(line.split(":")[1].strip())
-        elif "Stories with legacy 'difficulty' field:" in line:
-            issues["legacy_difficulty"] = int(line.split(":")[1].strip())
-        elif "Stories with invalid categories:" in line:
-            issues["invalid_categories"] = int(line.split(":")[1].strip())
-        elif "Stories with title mismatches:" in line:
-            issues["title_mismatches"] = int(line.split(":")[1].strip())
-        elif "Vocabulary count mismatches:" in line:
-            issues["vocab_count_mismatches"] = int(line.split(":")[1].strip())
-        elif "Question count mismatches:" in line:
-            issues["question_count_mismatches"] = int(line.split(":")[1].strip())
-        elif "Questions with non-standard option count:" in line:
-            issues["question_structure_issues"] = int(line.split(":")[1].strip())
-        elif line.startswith("Total issues found:"):
-            issues["total_issues"] = int(line.split(":")[1].strip())
+    _collect_counts(_STORY_RE, content, issues)
+    total_stories = issues.pop("total_stories", 0)
     
     return {
         "available": True,
@@ -107,15 +254,14 @@ def parse_frequency_validation(content: str) -> Dict[str, Any]:
         "valid": False
     }
     
-    for line in content.split('\n'):
-        if line.startswith("Total words:"):
-            data["total_words"] = int(line.split(":")[1].strip())
-        elif line.startswith("Structure valid:"):
-            data["valid"] = line.split(":")[1].strip() == "True"
-        elif line.startswith("NO ERRORS FOUND"):
-            data["errors"] = []
-        elif line.startswith("- A1+A2 levels only"):
-            data["warnings"].append(line.strip("- "))
+    for match in _FREQUENCY_RE.finditer(content):
+        key = match.lastgroup
+        if key == "warning":
+            data["warnings"].append(match[key])
+        elif key == "valid":
+            data["valid"] = match[key] == "True"
+        else:
+            data[key] = int(match[key])
     
     return {
         "available": True,
@@ -140,45 +286,7 @@ def parse_vocabulary_validation(content: str) -> Dict[str, Any]:
         "duplicate_words": 0
     }
     
-    for line in content.split('\n'):
-        if line.startswith("Total categories:"):
-            data["total_categories"] = int(line.split(":")[1].strip())
-        elif line.startswith("Total vocabulary words:"):
-            data["total_words"] = int(line.split(":")[1].strip())
-        elif "Words with learning tips:" in line:
-            parts = line.split(":")
-            if len(parts) > 1:
-                nums = parts[1].split("/")
-                if len(nums) >= 2:
-                    data["words_with_tips"] = int(nums[0].strip())
-        elif "Vocabulary words in frequency data:" in line:
-            parts = line.split(":")
-            if len(parts) > 1:
-                nums = parts[1].split("/")
-                if len(nums) >= 2:
-                    data["words_in_frequency"] = int(nums[0].strip())
-        elif "Vocabulary words NOT in frequency data:" in line:
-            data["words_not_in_frequency"] = int(line.split(":")[1].strip())
-        elif "Top 100 words in vocabulary:" in line:
-            parts = line.split(":")
-            if len(parts) > 1:
-                nums = parts[1].split("/")
-                if len(nums) >= 2:
-                    data["top100_coverage"] = int(nums[0].strip())
-        elif "Top 500 words in vocabulary:" in line:
-            parts = line.split(":")
-            if len(parts) > 1:
-                nums = parts[1].split("/")
-                if len(nums) >= 2:
-                    data["top500_coverage"] = int(nums[0].strip())
-        elif "Top 1000 words in vocabulary:" in line:
-            parts = line.split(":")
-            if len(parts) > 1:
-                nums = parts[1].split("/")
-                if len(nums) >= 2:
-                    data["top1000_coverage"] = int(nums[0].strip())
-        elif "Total words in multiple categories:" in line:
-            data["duplicate_words"] = int(line.split(":")[1].strip())
+    _collect_counts(_VOCABULARY_RE, content, data)
     
     return {
         "available": True,
@@ -198,15 +306,7 @@ def parse_crossref_validation(content: str) -> Dict[str, Any]:
         "inconsistent_translations": 0
     }
     
-    for line in content.split('\n'):
-        if line.startswith("Total stories:"):
-            data["total_stories"] = int(line.split(":")[1].strip())
-        elif line.startswith("Total orphaned vocabulary words:"):
-            data["orphaned_vocab"] = int(line.split(":")[1].strip())
-        elif line.startswith("Total vocabulary words missing from database:"):
-            data["missing_from_db"] = int(line.split(":")[1].strip())
-        elif line.startswith("Total inconsistent translations:"):
-            data["inconsistent_translations"] = int(line.split(":")[1].strip())
+    _collect_counts(_CROSSREF_RE, content, data)
     
     return {
         "available": True,
@@ -226,15 +326,16 @@ def parse_manifest_validation(content: str) -> Dict[str, Any]:
         "errors": []
     }
     
-    for line in content.split('\n'):
-        if line.startswith("Stories in manifest:"):
-            data["stories_in_manifest"] = int(line.split(":")[1].strip())
-        elif line.startswith("Story files found:"):
-            data["story_files_found"] = int(line.split(":")[1].strip())
-        elif line.startswith("Manifest structure valid:"):
-            data["valid"] = line.split(":")[1].strip() == "True"
-        elif line.startswith("NO ERRORS FOUND"):
-            data["errors"] = []
+    pending = set(_MANIFEST_RE.groupindex)
+    for match in _MANIFEST_RE.finditer(content):
+        key = match.lastgroup
+        if key == "valid":
+            data["valid"] = match[key] == "True"
+        else:
+            data[key] = int(match[key])
+        pending.discard(key)
+        if not pending:
+            break
     
     return {
         "available": True,
@@ -242,91 +343,44 @@ def parse_manifest_validation(content: str) -> Dict[str, Any]:
     }
 
 
-def calculate_health_score(parsed_results: Dict[str, Any]) -> Dict[str, Any]:
-    """Calculate overall data health score."""
-    scores = {}
-    
-    # Story validation score (0-100)
-    if parsed_results["story"]["available"]:
-        story_data = parsed_results["story"]
-        total_issues = story_data["issues"]["total_issues"]
-        total_stories = story_data["total_stories"]
-        # Deduct points for each issue type
-        deductions = 0
-        deductions += story_data["issues"]["legacy_difficulty"] * 0.5  # Minor issue
-        deductions += story_data["issues"]["invalid_categories"] * 2  # Major issue
-        deductions += story_data["issues"]["title_mismatches"] * 0.3  # Minor issue
-        deductions += story_data["issues"]["vocab_count_mismatches"] * 1  # Medium issue
-        deductions += story_data["issues"]["question_count_mismatches"] * 1  # Medium issue
-        deductions += story_data["issues"]["question_structure_issues"] * 3  # Major issue
-        
-        scores["story"] = max(0, 100 - deductions)
-    else:
-        scores["story"] = None
-    
-    # Frequency validation score (0-100)
-    if parsed_results["frequency"]["available"]:
-        freq_data = parsed_results["frequency"]["data"]
-        score = 100 if freq_data["valid"] else 0
-        score -= len(freq_data["warnings"]) * 5  # Deduct for warnings
-        scores["frequency"] = max(0, score)
-    else:
-        scores["frequency"] = None
-    
-    # Vocabulary validation score (0-100)
-    if parsed_results["vocabulary"]["available"]:
-        vocab_data = parsed_results["vocabulary"]["data"]
-        score = 100
-        # Deduct for missing frequency data
-        if vocab_data["total_words"] > 0:
-            missing_pct = (vocab_data["words_not_in_frequency"] / vocab_data["total_words"]) * 100
-            score -= missing_pct * 0.3  # 30% weight
-        # Deduct for low tip coverage
-        if vocab_data["total_words"] > 0:
-            tip_pct = (vocab_data["words_with_tips"] / vocab_data["total_words"]) * 100
-            if tip_pct < 10:
-                score -= (10 - tip_pct) * 0.5  # Deduct if below 10%
-        scores["vocabulary"] = max(0, score)
-    else:
-        scores["vocabulary"] = None
-    
-    # Cross-reference validation score (0-100)
-    if parsed_results["crossref"]["available"]:
-        crossref_data = parsed_results["crossref"]["data"]
-        score = 100
-        score -= crossref_data["orphaned_vocab"] * 2  # Major issue
-        score -= crossref_data["missing_from_db"] * 1  # Medium issue
-        score -= crossref_data["inconsistent_translations"] * 3  # Major issue
-        scores["crossref"] = max(0, score)
-    else:
-        scores["crossref"] = None
-    
-    # Manifest validation score (0-100)
-    if parsed_results["manifest"]["available"]:
-        manifest_data = parsed_results["manifest"]["data"]
-        score = 100 if manifest_data["valid"] else 0
-        if manifest_data["stories_in_manifest"] != manifest_data["story_files_found"]:
-            score -= 20  # Major issue
-        scores["manifest"] = max(0, score)
-    else:
-        scores["manifest"] = None
-    
-    # Overall score (average of available scores)
-    available_scores = [s for s in scores.values() if s is not None]
-    overall = sum(available_scores) / len(available_scores) if available_scores else 0
-    
-    return {
-        "scores": scores,
-        "overall": overall
-    }
+_PARSERS = {
+    "story": parse_story_validation,
+    "frequency": parse_frequency_validation,
+    "vocabulary": parse_vocabulary_validation,
+    "crossref": parse_crossref_validation,
+    "manifest": parse_manifest_validation,
+}
+
 
+def parse_validation_results(raw_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse all loaded validation results, keyed like load_validation_results()."""
+    return {kind: _PARSERS[kind](content) for kind, content in raw_results.items()}
 
-def generate_csv_report(stories: List[Dict], crossref_content: str) -> List[Dict[str, str]]:
+
+# Crossref report section titles (header text before any " (..." note) mapped
+# to CSV issue types, and the "Story: <id> - <title>" line that opens each
+# story's entries.
+_CROSSREF_SECTIONS = {
+    "ORPHANED VOCABULARY": "ORPHANED",
+    "VOCABULARY MISSING FROM DATABASE": "MISSING",
+    "INCONSISTENT TRANSLATIONS": "INCONSISTENT",
+}
+_STORY_HEADER_RE = re.compile(r"Story:\s+([^\s]+)\s+-\s+(.+)")
+
+CSV_FIELDNAMES = ['story_filename', 'story_title', 'word', 'word_finnish', 'issue_type',
+                  'phrase_number', 'phrase_spanish', 'phrase_finnish', 'phrase_english']
+
+
+def generate_csv_report(stories: List[Dict], crossref_content: str) -> Iterator[Tuple[Any, ...]]:
     """
     Generate CSV data with detailed issue information.
     
-    Returns list of dictionaries with fields:
+    Rows are yielded as they are parsed so they can be written out without
+    holding the whole issue list in memory.
+    
+    Yields tuples with values in CSV_FIELDNAMES order, ready for csv.writer:
     - story_filename: Story file name
+    - story_title: Story title from the crossref report
     - word: The problematic word (Spanish)
     - word_finnish: Finnish translation from story vocabulary
     - issue_type: ORPHANED|MISSING|INCONSISTENT
@@ -335,413 +389,537 @@ def generate_csv_report(stories: List[Dict], crossref_content: str) -> List[Dict
     - phrase_finnish: Finnish translation of the phrase
     - phrase_english: English translation of the phrase
     """
-    csv_data = []
-    
     if not crossref_content:
-        return csv_data
+        return
+    
+    # Index stories by id once; the first story with an id wins, as with a
+    # front-to-back search. Per-story lookup state is built on demand the
+    # first time a story's header is seen: (vocabulary index, lowercased
+    # dialogue lines, token first-hit memo).
+    stories_by_id = {}
+    for story in stories:
+        stories_by_id.setdefault(story.get('id'), story)
+    story_states = {}
     
     # Parse the crossref report to extract detailed information
     current_section = None
     current_story = None
     current_story_title = None
+    story_data = None
+    story_vocabulary, story_dialogue_lower, story_first_hits = {}, [], {}
     
-    lines = crossref_content.split('\n')
-    i = 0
+    # Walk the report lazily; StringIO yields one line at a time without
+    # materializing a list of every line in the report.
+    lines = io.StringIO(crossref_content)
     
-    while i < len(lines):
-        line = lines[i].strip()
+    for raw_line in lines:
+        line = raw_line.strip()
         
-        # Stop at RECOMMENDATIONS section
-        if "RECOMMENDATIONS" in line:
-            break
-        
-        # Detect section headers
-        if "ORPHANED VOCABULARY" in line:
-            current_section = "ORPHANED"
-        elif "VOCABULARY MISSING FROM DATABASE" in line:
-            current_section = "MISSING"
-        elif "INCONSISTENT TRANSLATIONS" in line:
-            current_section = "INCONSISTENT"
+        # Section headers are all caps, so a capital second character tells
+        # them apart from "Story:", summary, word and separator lines; the
+        # header title then picks the section with one dict lookup.
+        if line[1:2].isupper():
+            title = line.partition(" (")[0]
+            
+            # Stop at RECOMMENDATIONS section
+            if title == "RECOMMENDATIONS":
+                break
+            
+            current_section = _CROSSREF_SECTIONS.get(title, current_section)
         elif line.startswith("Story:"):
             # Extract story ID and title
-            match = re.match(r"Story:\s+([^\s]+)\s+-\s+(.+)", line)
+            match = _STORY_HEADER_RE.match(line)
             if match:
                 current_story = match.group(1)
                 current_story_title = match.group(2)
+                story_data = stories_by_id.get(current_story)
+                if story_data:
+                    state = story_states.get(current_story)
+                    if state is None:
+                        state = story_states[current_story] = (
+                            build_vocabulary_index(story_data.get('vocabulary', [])),
+                            [entry.get('spanish', '').lower() for entry in story_data.get('dialogue', [])],
+                            {},
+                        )
+                    story_vocabulary, story_dialogue_lower, story_first_hits = state
         elif line.startswith("- ") and current_section and current_story:
             # Extract word from the line
             word = line[2:].strip()
             
             # Skip lines that are part of recommendations or sub-items
             if any(skip_word in word.lower() for skip_word in ['standardize', 'choose', 'update', 'review', 'add', 'consider']):
-                i += 1
                 continue
             
             # For INCONSISTENT section, skip the "Story:" and "DB:" lines that follow
             if current_section == "INCONSISTENT":
                 # Skip next two lines (Story: and DB:)
-                i += 2
-            
-            # Find the story data
-            story_data = next((s for s in stories if s.get('id') == current_story), None)
+                next(lines, None)
+                next(lines, None)
             
             if story_data:
                 # Get Finnish translation from story vocabulary
-                word_finnish = get_finnish_from_vocabulary(word, story_data.get('vocabulary', []))
+                word_finnish = story_vocabulary.get(word.lower(), '')
                 
                 # Find phrase containing this word in dialogue
                 dialogue = story_data.get('dialogue', [])
-                phrase_info = find_word_in_dialogue(word, dialogue)
+                phrase_info = find_word_in_dialogue(word, dialogue, story_first_hits, story_dialogue_lower)
                 
-                csv_row = {
-                    'story_filename': f"{current_story}.json",
-                    'story_title': current_story_title,
-                    'word': word,
-                    'word_finnish': word_finnish,
-                    'issue_type': current_section,
-                    'phrase_number': phrase_info['phrase_number'],
-                    'phrase_spanish': phrase_info['spanish'],
-                    'phrase_finnish': phrase_info['finnish'],
-                    'phrase_english': phrase_info['english']
-                }
-                csv_data.append(csv_row)
-        
-        i += 1
-    
-    return csv_data
+                yield (
+                    f"{current_story}.json",
+                    current_story_title,
+                    word,
+                    word_finnish,
+                    current_section,
+                    phrase_info['phrase_number'],
+                    phrase_info['spanish'],
+                    phrase_info['finnish'],
+                    phrase_info['english'],
+                )
 
 
-def get_finnish_from_vocabulary(spanish_word: str, vocabulary: List[Dict]) -> str:
+def build_vocabulary_index(vocabulary: List[Dict]) -> Dict[str, str]:
     """
-    Get Finnish translation from story vocabulary list.
+    Map lowercased Spanish words of a story vocabulary list to their Finnish
+    translation. The first entry for a word wins.
     """
+    index = {}
     for vocab_entry in vocabulary:
-        if vocab_entry.get('spanish', '').lower() == spanish_word.lower():
-            return vocab_entry.get('finnish', '')
-    return ''
+        index.setdefault(vocab_entry.get('spanish', '').lower(), vocab_entry.get('finnish', ''))
+    return index
 
 
-def find_word_in_dialogue(word: str, dialogue: List[Dict]) -> Dict[str, str]:
+class _WordCharTable(dict):
+    """str.translate table keeping word characters and blanking out the rest.
+    
+    Word characters are those of regex ``\\w`` (alphanumerics and ``_``).
+    Entries are filled in on first lookup, so the table stays small.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        self[codepoint] = result = codepoint if char.isalnum() or char == '_' else 32
+        return result
+
+
+# Searching dialogue for a vocabulary word uses its lowercase Spanish tokens:
+# runs of word characters made up only of _TOKEN_CHARS, minus articles.
+_WORD_CHARS = _WordCharTable()
+_TOKEN_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzáéíóúñü')
+_ARTICLES = frozenset({'el', 'la', 'los', 'las', 'un', 'una', 'unos', 'unas'})
+_ARTICLE_PREFIXES = tuple(f"{article} " for article in ('el', 'la', 'los', 'las', 'un', 'una', 'unos', 'unas'))
+_NO_PHRASE = {
+    'phrase_number': 'N/A',
+    'spanish': '',
+    'finnish': '',
+    'english': ''
+}
+
+
+def find_word_in_dialogue(word: str, dialogue: List[Dict],
+                          first_hits: Optional[Dict[str, int]] = None,
+                          dialogue_lower: Optional[List[str]] = None) -> Dict[str, str]:
     """
     Find a word in the dialogue and return phrase information.
     Returns dict with phrase_number, spanish, finnish, english.
+    
+    The phrase is the first dialogue line containing any significant token
+    of the word, i.e. the earliest first hit over its tokens. ``first_hits``
+    memoizes each token's first-hit line index (len(dialogue) if absent);
+    pass the same dict for every word of a story so that tokens shared by
+    several words are searched for only once. ``dialogue_lower`` is the
+    lowercased Spanish text of each dialogue line; pass it when looking up
+    several words in the same dialogue to lowercase the lines only once.
     """
     # Normalize word for searching (remove articles, lowercase)
     search_word = word.lower().strip()
-    for article in ['el ', 'la ', 'los ', 'las ', 'un ', 'una ', 'unos ', 'unas ']:
-        if search_word.startswith(article):
-            search_word = search_word[len(article):]
-            break
+    if search_word.startswith(_ARTICLE_PREFIXES):
+        # Every prefix is one word plus a space, so drop up to the first space
+        search_word = search_word.split(' ', 1)[1]
     
     # Extract significant tokens from the word
-    word_tokens = re.findall(r'\b[a-záéíóúñü]+\b', search_word)
-    articles = {'el', 'la', 'los', 'las', 'un', 'una', 'unos', 'unas'}
-    significant_tokens = [t for t in word_tokens if t not in articles]
+    significant_tokens = [
+        t for t in search_word.translate(_WORD_CHARS).split()
+        if t not in _ARTICLES and _TOKEN_CHARS.issuperset(t)
+    ]
     
     # Search through dialogue
-    for idx, line in enumerate(dialogue, 1):
-        spanish_text = line.get('spanish', '').lower()
-        
-        # Check if any significant token appears in this line
-        for token in significant_tokens:
-            if token in spanish_text:
-                return {
-                    'phrase_number': str(idx),
-                    'spanish': line.get('spanish', ''),
-                    'finnish': line.get('finnish', ''),
-                    'english': line.get('english', '')
-                }
-    
-    # If not found in dialogue, return empty
+    if first_hits is None:
+        first_hits = {}
+    if dialogue_lower is None and significant_tokens:
+        dialogue_lower = [line.get('spanish', '').lower() for line in dialogue]
+    no_hit = len(dialogue)
+    best = no_hit
+    for token in significant_tokens:
+        idx = first_hits.get(token)
+        if idx is None:
+            idx = next((i for i, text in enumerate(dialogue_lower) if token in text), no_hit)
+            first_hits[token] = idx
+        if idx < best:
+            best = idx
+    
+    if best == no_hit:
+        # If not found in dialogue, return empty
+        return dict(_NO_PHRASE)
+    
+    line = dialogue[best]
     return {
-        'phrase_number': 'N/A',
-        'spanish': '',
-        'finnish': '',
-        'english': ''
+        'phrase_number': str(best + 1),
+        'spanish': line.get('spanish', ''),
+        'finnish': line.get('finnish', ''),
+        'english': line.get('english', '')
     }
 
 
-def generate_markdown_report(parsed_results: Dict[str, Any], health_scores: Dict[str, Any]) -> str:
-    """Generate markdown report."""
-    report = []
-    
-    # Header
-    report.append("# V4 Data Consistency Report")
-    report.append("")
-    report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
-    report.append("This report aggregates results from all data validation scripts to provide")
-    report.append("a comprehensive overview of data quality in Espanjapeli V4.")
-    report.append("")
-    
-    # Executive Summary
-    report.append("## Executive Summary")
-    report.append("")
-    
-    overall_score = health_scores["overall"]
-    if overall_score >= 90:
-        status = "🟢 EXCELLENT"
-        summary = "Data is in excellent condition with minimal issues."
-    elif overall_score >= 75:
-        status = "🟡 GOOD"
-        summary = "Data is in good condition with some minor issues to address."
-    elif overall_score >= 60:
-        status = "🟠 FAIR"
-        summary = "Data has several issues that should be addressed."
+def _story_section(story_data: Dict[str, Any], parts: List[str]) -> Optional[float]:
+    """Score story validation results and append their markdown section."""
+    if not story_data["available"]:
+        return None
+    issues = story_data["issues"]
+    # Deduct points for each issue type
+    score = max(0, 100 - _weighted_issue_count(issues, _STORY_ISSUE_WEIGHTS))
+    
+    parts.append(
+        "## Story Data Validation\n"
+        "\n"
+        f"**Total Stories:** {story_data['total_stories']}\n"
+        f"**Total Issues:** {issues['total_issues']}\n"
+        "\n"
+        "### Issues Breakdown\n"
+        "\n"
+    )
+    parts.extend(
+        f"- **{label}:** {issues[key]} {unit}\n"
+        for label, key, unit in _STORY_ISSUE_ROWS
+    )
+    parts.append(
+        "\n"
+        "### Priority Actions\n"
+        "\n"
+    )
+    if issues["legacy_difficulty"] > 0:
+        parts.append(f"1. **Remove legacy 'difficulty' field** from {issues['legacy_difficulty']} stories\n")
+    if issues["invalid_categories"] > 0:
+        parts.append(f"2. **Fix invalid categories** in {issues['invalid_categories']} stories\n")
+    if issues["vocab_count_mismatches"] > 0 or issues["question_count_mismatches"] > 0:
+        parts.append("3. **Regenerate manifest** to sync metadata counts\n")
+    if issues["question_structure_issues"] > 0:
+        parts.append(f"4. **Fix question structure** in {issues['question_structure_issues']} questions\n")
+    if issues["title_mismatches"] > 0:
+        parts.append(f"5. **Update story titles** to Finnish in {issues['title_mismatches']} stories\n")
+    parts.append("\n")
+    return score
+
+
+def _frequency_section(freq_result: Dict[str, Any], parts: List[str]) -> Optional[float]:
+    """Score frequency validation results and append their markdown section."""
+    if not freq_result["available"]:
+        return None
+    freq_data = freq_result["data"]
+    score = 100 if freq_data["valid"] else 0
+    score -= len(freq_data["warnings"]) * 5  # Deduct for warnings
+    
+    parts.append(
+        "## Frequency Data Validation\n"
+        "\n"
+        f"**Total Words:** {freq_data['total_words']}\n"
+        f"**Valid:** {'✅ Yes' if freq_data['valid'] else '❌ No'}\n"
+        "\n"
+    )
+    if freq_data["warnings"]:
+        parts.append("### Warnings\n\n")
+        parts.extend(f"- {warning}\n" for warning in freq_data["warnings"])
+        parts.append("\n")
+    else:
+        parts.append("✅ **No issues found** - Frequency data is valid\n\n")
+    return max(0, score)
+
+
+def _vocabulary_section(vocab_result: Dict[str, Any], parts: List[str]) -> Optional[float]:
+    """Score vocabulary validation results and append their markdown section."""
+    if not vocab_result["available"]:
+        return None
+    vocab_data = vocab_result["data"]
+    total_words = vocab_data["total_words"]
+    score = 100
+    if total_words > 0:
+        # Deduct for missing frequency data
+        missing_pct = (vocab_data["words_not_in_frequency"] / total_words) * 100
+        score -= missing_pct * 0.3  # 30% weight
+        # Deduct for low tip coverage
+        tip_pct = (vocab_data["words_with_tips"] / total_words) * 100
+        if tip_pct < 10:
+            score -= (10 - tip_pct) * 0.5  # Deduct if below 10%
+    
+    parts.append(
+        "## Vocabulary Database Validation\n"
+        "\n"
+        f"**Total Categories:** {vocab_data['total_categories']}\n"
+        f"**Total Words:** {total_words}\n"
+        "\n"
+        "### Coverage Statistics\n"
+        "\n"
+    )
+    if total_words > 0:
+        in_freq_pct = (vocab_data["words_in_frequency"] / total_words) * 100
+        parts.append(f"- **Words in frequency data:** {vocab_data['words_in_frequency']}/{total_words} ({in_freq_pct:.1f}%)\n")
+    parts.append(f"- **Words NOT in frequency data:** {vocab_data['words_not_in_frequency']}\n")
+    parts.extend(
+        f"- **Top {top_n} coverage:** {vocab_data[key]}/{top_n}\n"
+        for top_n, key in _TOP_COVERAGE_ROWS
+    )
+    parts.append(
+        "\n"
+        "### Learning Tips\n"
+        "\n"
+    )
+    if total_words > 0:
+        parts.append(f"- **Words with tips:** {vocab_data['words_with_tips']}/{total_words} ({tip_pct:.1f}%)\n")
+    parts.append("\n")
+    
+    if vocab_data["duplicate_words"] > 0:
+        parts.append(
+            "### Duplicates\n"
+            "\n"
+            f"- **Words in multiple categories:** {vocab_data['duplicate_words']}\n"
+            "\n"
+        )
+    return max(0, score)
+
+
+def _crossref_section(crossref_result: Dict[str, Any], parts: List[str]) -> Optional[float]:
+    """Score cross-reference validation results and append their markdown section."""
+    if not crossref_result["available"]:
+        return None
+    crossref_data = crossref_result["data"]
+    orphaned_vocab = crossref_data["orphaned_vocab"]
+    missing_from_db = crossref_data["missing_from_db"]
+    inconsistent_translations = crossref_data["inconsistent_translations"]
+    score = max(0, 100 - _weighted_issue_count(crossref_data, _CROSSREF_ISSUE_WEIGHTS))
+    
+    parts.append(
+        "## Story-Vocabulary Cross-Reference\n"
+        "\n"
+        f"**Stories Analyzed:** {crossref_data['total_stories']}\n"
+        "\n"
+        "### Issues Found\n"
+        "\n"
+        f"- **Orphaned vocabulary words:** {orphaned_vocab}\n"
+        "  _(Words in story vocabulary but not in dialogue)_\n"
+        "\n"
+        f"- **Missing from database:** {missing_from_db}\n"
+        "  _(Story vocabulary words not in main database)_\n"
+        "\n"
+        f"- **Inconsistent translations:** {inconsistent_translations}\n"
+        "  _(Different translations between story and database)_\n"
+        "\n"
+    )
+    if orphaned_vocab > 0 or missing_from_db > 0 or inconsistent_translations > 0:
+        parts.append("### Recommendations\n\n")
+        if orphaned_vocab > 0:
+            parts.append("1. Review orphaned vocabulary and update dialogues to include these words\n")
+        if missing_from_db > 0:
+            parts.append("2. Add missing words to main vocabulary database (words.ts)\n")
+        if inconsistent_translations > 0:
+            parts.append("3. Standardize translations between stories and database\n")
+        parts.append("\n")
+    return score
+
+
+def _manifest_section(manifest_result: Dict[str, Any], parts: List[str]) -> Optional[float]:
+    """Score manifest validation results and append their markdown section."""
+    if not manifest_result["available"]:
+        return None
+    manifest_data = manifest_result["data"]
+    manifest_valid = manifest_data["valid"]
+    in_sync = manifest_data["stories_in_manifest"] == manifest_data["story_files_found"]
+    score = 100 if manifest_valid else 0
+    if not in_sync:
+        score -= 20  # Major issue
+    
+    parts.append(
+        "## Manifest Validation\n"
+        "\n"
+        f"**Stories in Manifest:** {manifest_data['stories_in_manifest']}\n"
+        f"**Story Files Found:** {manifest_data['story_files_found']}\n"
+        f"**Valid:** {'✅ Yes' if manifest_valid else '❌ No'}\n"
+        "\n"
+    )
+    if manifest_valid and in_sync:
+        parts.append("✅ **No issues found** - Manifest is in sync with story files\n\n")
     else:
-        status = "🔴 NEEDS ATTENTION"
-        summary = "Data has significant issues that require immediate attention."
+        parts.append("### Issues\n\n")
+        if not manifest_valid:
+            parts.append("- Manifest structure is invalid\n")
+        if not in_sync:
+            parts.append("- Manifest and story files are out of sync\n")
+        parts.append("\n")
+    return max(0, score)
+
+
+# Report sections in output order: (component, scoring + rendering function).
+_SECTIONS = (
+    ("story", _story_section),
+    ("frequency", _frequency_section),
+    ("vocabulary", _vocabulary_section),
+    ("crossref", _crossref_section),
+    ("manifest", _manifest_section),
+)
+
+
+def generate_markdown_report(parsed_results: Dict[str, Any], out: TextIO) -> Dict[str, Any]:
+    """Score all components and write the markdown report to the text stream ``out``.
     
-    report.append(f"**Overall Health Score:** {overall_score:.1f}/100 - {status}")
-    report.append("")
-    report.append(summary)
-    report.append("")
+    Each section is scored and rendered in the same pass over
+    ``parsed_results``. The executive summary at the top needs the overall
+    score, so section bodies are collected first and written after it.
     
-    # Component Scores
-    report.append("### Component Scores")
-    report.append("")
-    report.append("| Component | Score | Status |")
-    report.append("|-----------|-------|--------|")
+    Returns the health scores as ``{"scores": {...}, "overall": float}``.
+    """
+    # Each section is a single template; adjacent f-string literals are
+    # joined at compile time, so a section costs one append.
+    parts: List[str] = []
+    scores = {component: section(parsed_results[component], parts) for component, section in _SECTIONS}
     
-    for component, score in health_scores["scores"].items():
-        if score is not None:
-            if score >= 90:
-                status_icon = "🟢"
-            elif score >= 75:
-                status_icon = "🟡"
-            elif score >= 60:
-                status_icon = "🟠"
-            else:
-                status_icon = "🔴"
-            report.append(f"| {component.title()} | {score:.1f} | {status_icon} |")
-        else:
-            report.append(f"| {component.title()} | N/A | ⚪ |")
-    
-    report.append("")
-    
-    # Story Validation
-    if parsed_results["story"]["available"]:
-        report.append("## Story Data Validation")
-        report.append("")
-        story_data = parsed_results["story"]
-        report.append(f"**Total Stories:** {story_data['total_stories']}")
-        report.append(f"**Total Issues:** {story_data['issues']['total_issues']}")
-        report.append("")
-        
-        report.append("### Issues Breakdown")
-        report.append("")
-        issues = story_data["issues"]
-        report.append(f"- **Legacy 'difficulty' field:** {issues['legacy_difficulty']} stories")
-        report.append(f"- **Invalid categories:** {issues['invalid_categories']} stories")
-        report.append(f"- **Title mismatches:** {issues['title_mismatches']} stories")
-        report.append(f"- **Vocabulary count mismatches:** {issues['vocab_count_mismatches']} stories")
-        report.append(f"- **Question count mismatches:** {issues['question_count_mismatches']} stories")
-        report.append(f"- **Question structure issues:** {issues['question_structure_issues']} questions")
-        report.append("")
-        
-        report.append("### Priority Actions")
-        report.append("")
-        if issues["legacy_difficulty"] > 0:
-            report.append(f"1. **Remove legacy 'difficulty' field** from {issues['legacy_difficulty']} stories")
-        if issues["invalid_categories"] > 0:
-            report.append(f"2. **Fix invalid categories** in {issues['invalid_categories']} stories")
-        if issues["vocab_count_mismatches"] > 0 or issues["question_count_mismatches"] > 0:
-            report.append(f"3. **Regenerate manifest** to sync metadata counts")
-        if issues["question_structure_issues"] > 0:
-            report.append(f"4. **Fix question structure** in {issues['question_structure_issues']} questions")
-        if issues["title_mismatches"] > 0:
-            report.append(f"5. **Update story titles** to Finnish in {issues['title_mismatches']} stories")
-        report.append("")
-    
-    # Frequency Validation
-    if parsed_results["frequency"]["available"]:
-        report.append("## Frequency Data Validation")
-        report.append("")
-        freq_data = parsed_results["frequency"]["data"]
-        report.append(f"**Total Words:** {freq_data['total_words']}")
-        report.append(f"**Valid:** {'✅ Yes' if freq_data['valid'] else '❌ No'}")
-        report.append("")
-        
-        if freq_data["warnings"]:
-            report.append("### Warnings")
-            report.append("")
-            for warning in freq_data["warnings"]:
-                report.append(f"- {warning}")
-            report.append("")
-        else:
-            report.append("✅ **No issues found** - Frequency data is valid")
-            report.append("")
-    
-    # Vocabulary Validation
-    if parsed_results["vocabulary"]["available"]:
-        report.append("## Vocabulary Database Validation")
-        report.append("")
-        vocab_data = parsed_results["vocabulary"]["data"]
-        report.append(f"**Total Categories:** {vocab_data['total_categories']}")
-        report.append(f"**Total Words:** {vocab_data['total_words']}")
-        report.append("")
-        
-        report.append("### Coverage Statistics")
-        report.append("")
-        if vocab_data["total_words"] > 0:
-            in_freq_pct = (vocab_data["words_in_frequency"] / vocab_data["total_words"]) * 100
-            report.append(f"- **Words in frequency data:** {vocab_data['words_in_frequency']}/{vocab_data['total_words']} ({in_freq_pct:.1f}%)")
-        report.append(f"- **Words NOT in frequency data:** {vocab_data['words_not_in_frequency']}")
-        report.append(f"- **Top 100 coverage:** {vocab_data['top100_coverage']}/100")
-        report.append(f"- **Top 500 coverage:** {vocab_data['top500_coverage']}/500")
-        report.append(f"- **Top 1000 coverage:** {vocab_data['top1000_coverage']}/1000")
-        report.append("")
-        
-        report.append("### Learning Tips")
-        report.append("")
-        if vocab_data["total_words"] > 0:
-            tip_pct = (vocab_data["words_with_tips"] / vocab_data["total_words"]) * 100
-            report.append(f"- **Words with tips:** {vocab_data['words_with_tips']}/{vocab_data['total_words']} ({tip_pct:.1f}%)")
-        report.append("")
-        
-        if vocab_data["duplicate_words"] > 0:
-            report.append("### Duplicates")
-            report.append("")
-            report.append(f"- **Words in multiple categories:** {vocab_data['duplicate_words']}")
-            report.append("")
-    
-    # Cross-reference Validation
-    if parsed_results["crossref"]["available"]:
-        report.append("## Story-Vocabulary Cross-Reference")
-        report.append("")
-        crossref_data = parsed_results["crossref"]["data"]
-        report.append(f"**Stories Analyzed:** {crossref_data['total_stories']}")
-        report.append("")
-        
-        report.append("### Issues Found")
-        report.append("")
-        report.append(f"- **Orphaned vocabulary words:** {crossref_data['orphaned_vocab']}")
-        report.append(f"  _(Words in story vocabulary but not in dialogue)_")
-        report.append("")
-        report.append(f"- **Missing from database:** {crossref_data['missing_from_db']}")
-        report.append(f"  _(Story vocabulary words not in main database)_")
-        report.append("")
-        report.append(f"- **Inconsistent translations:** {crossref_data['inconsistent_translations']}")
-        report.append(f"  _(Different translations between story and database)_")
-        report.append("")
-        
-        if crossref_data["orphaned_vocab"] > 0 or crossref_data["missing_from_db"] > 0 or crossref_data["inconsistent_translations"] > 0:
-            report.append("### Recommendations")
-            report.append("")
-            if crossref_data["orphaned_vocab"] > 0:
-                report.append("1. Review orphaned vocabulary and update dialogues to include these words")
-            if crossref_data["missing_from_db"] > 0:
-                report.append("2. Add missing words to main vocabulary database (words.ts)")
-            if crossref_data["inconsistent_translations"] > 0:
-                report.append("3. Standardize translations between stories and database")
-            report.append("")
-    
-    # Manifest Validation
-    if parsed_results["manifest"]["available"]:
-        report.append("## Manifest Validation")
-        report.append("")
-        manifest_data = parsed_results["manifest"]["data"]
-        report.append(f"**Stories in Manifest:** {manifest_data['stories_in_manifest']}")
-        report.append(f"**Story Files Found:** {manifest_data['story_files_found']}")
-        report.append(f"**Valid:** {'✅ Yes' if manifest_data['valid'] else '❌ No'}")
-        report.append("")
-        
-        if manifest_data["valid"] and manifest_data["stories_in_manifest"] == manifest_data["story_files_found"]:
-            report.append("✅ **No issues found** - Manifest is in sync with story files")
-            report.append("")
-        else:
-            report.append("### Issues")
-            report.append("")
-            if not manifest_data["valid"]:
-                report.append("- Manifest structure is invalid")
-            if manifest_data["stories_in_manifest"] != manifest_data["story_files_found"]:
-                report.append("- Manifest and story files are out of sync")
-            report.append("")
+    # Overall score (average of available scores)
+    available_scores = [s for s in scores.values() if s is not None]
+    overall_score = sum(available_scores) / len(available_scores) if available_scores else 0
+    status, summary, next_steps = _HEALTH_STATUS[_score_band(overall_score)]
+    
+    # Header, Executive Summary and Component Scores
+    out.write(
+        "# V4 Data Consistency Report\n"
+        "\n"
+        f"**Generated:** {datetime.now().isoformat(sep=' ', timespec='seconds')}\n"
+        "\n"
+        "This report aggregates results from all data validation scripts to provide\n"
+        "a comprehensive overview of data quality in Espanjapeli V4.\n"
+        "\n"
+        "## Executive Summary\n"
+        "\n"
+        f"**Overall Health Score:** {overall_score:.1f}/100 - {status}\n"
+        "\n"
+        f"{summary}\n"
+        "\n"
+        "### Component Scores\n"
+        "\n"
+        "| Component | Score | Status |\n"
+        "|-----------|-------|--------|\n"
+    )
+    out.writelines(
+        f"| {component.title()} | {score:.1f} | {_STATUS_ICONS[_score_band(score)]} |\n"
+        if score is not None else f"| {component.title()} | N/A | ⚪ |\n"
+        for component, score in scores.items()
+    )
+    out.write("\n")
+    out.writelines(parts)
     
     # Next Steps
-    report.append("## Next Steps")
-    report.append("")
+    out.write("## Next Steps\n\n")
+    out.write(next_steps)
     
-    if overall_score >= 90:
-        report.append("Data quality is excellent. Continue monitoring with periodic validation runs.")
-    elif overall_score >= 75:
-        report.append("Address minor issues identified above to improve data quality.")
-    else:
-        report.append("**Priority actions required:**")
-        report.append("")
-        report.append("1. Run individual validation scripts for detailed issue lists")
-        report.append("2. Address high-priority issues (invalid categories, question structure)")
-        report.append("3. Regenerate manifest after fixing story data")
-        report.append("4. Add missing vocabulary to database")
-        report.append("5. Standardize translations across all data sources")
+    # Footer
+    out.write(
+        "\n"
+        "---\n"
+        "\n"
+        "## Validation Scripts\n"
+        "\n"
+        "This report aggregates data from:\n"
+        "\n"
+        "- `scripts/test_story_data_integrity.py` - Story structure validation\n"
+        "- `scripts/validate_frequency_data.py` - Frequency data validation\n"
+        "- `scripts/validate_vocabulary_database.py` - Vocabulary database validation\n"
+        "- `scripts/validate_story_vocabulary_crossref.py` - Cross-reference validation\n"
+        "- `scripts/validate_manifest.py` - Manifest sync validation\n"
+        "\n"
+        "To regenerate this report, run:\n"
+        "```bash\n"
+        "python scripts/generate_data_consistency_report.py\n"
+        "```\n"
+    )
     
-    report.append("")
+    return {
+        "scores": scores,
+        "overall": overall_score
+    }
+
+
+class EncodedChunks:
+    """Minimal text sink that keeps every write as a UTF-8 encoded chunk."""
     
-    # Footer
-    report.append("---")
-    report.append("")
-    report.append("## Validation Scripts")
-    report.append("")
-    report.append("This report aggregates data from:")
-    report.append("")
-    report.append("- `scripts/test_story_data_integrity.py` - Story structure validation")
-    report.append("- `scripts/validate_frequency_data.py` - Frequency data validation")
-    report.append("- `scripts/validate_vocabulary_database.py` - Vocabulary database validation")
-    report.append("- `scripts/validate_story_vocabulary_crossref.py` - Cross-reference validation")
-    report.append("- `scripts/validate_manifest.py` - Manifest sync validation")
-    report.append("")
-    report.append("To regenerate this report, run:")
-    report.append("```bash")
-    report.append("python scripts/generate_data_consistency_report.py")
-    report.append("```")
-    report.append("")
-    
-    return "\n".join(report)
-
-
-def main():
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+    
+    def write(self, text: str) -> int:
+        self.chunks.append(text.encode('utf-8'))
+        return len(text)
+    
+    def writelines(self, lines) -> None:
+        self.chunks.extend(line.encode('utf-8') for line in lines)
+
+
+def write_chunks(path: Path, chunks: List[bytes]) -> None:
+    """Write byte chunks to ``path`` with scatter-gather writes, without joining them."""
+    with open(path, 'wb') as f:
+        if not hasattr(os, "writev"):
+            f.writelines(chunks)
+            return
+        fd = f.fileno()
+        views = [memoryview(chunk) for chunk in chunks if chunk]
+        start = 0
+        while start < len(views):
+            written = os.writev(fd, views[start:start + _IOV_MAX])
+            # Drop fully written chunks and trim a partially written one.
+            while written:
+                size = len(views[start])
+                if written < size:
+                    views[start] = views[start][written:]
+                    break
+                written -= size
+                start += 1
+
+
+def main(gzip_csv: bool = False):
     """Main execution."""
     print("Loading validation results...")
     raw_results = load_validation_results()
     
     print("Parsing validation data...")
-    parsed_results = {
-        "story": parse_story_validation(raw_results["story"]),
-        "frequency": parse_frequency_validation(raw_results["frequency"]),
-        "vocabulary": parse_vocabulary_validation(raw_results["vocabulary"]),
-        "crossref": parse_crossref_validation(raw_results["crossref"]),
-        "manifest": parse_manifest_validation(raw_results["manifest"])
-    }
+    parsed_results = parse_validation_results(raw_results)
     
-    print("Calculating health scores...")
-    health_scores = calculate_health_score(parsed_results)
-    
-    print("Generating markdown report...")
-    markdown_report = generate_markdown_report(parsed_results, health_scores)
-    
-    # Write markdown report
-    output_path = Path(__file__).parent.parent / "reports" / "v4-data-consistency-report.md"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(markdown_report)
+    print("Scoring data and generating markdown report...")
+    output_path = REPORTS_DIR / "v4-data-consistency-report.md"
+    markdown_chunks = EncodedChunks()
+    health_scores = generate_markdown_report(parsed_results, markdown_chunks)
+    write_chunks(output_path, markdown_chunks.chunks)
     
     print(f"\n✅ Markdown report generated: {output_path}")
     
     # Generate CSV report
     print("Generating CSV report...")
     stories = load_stories()
-    csv_data = generate_csv_report(stories, raw_results["crossref"])
-    
-    if csv_data:
-        csv_output_path = Path(__file__).parent.parent / "reports" / "v4-data-consistency-issues.csv"
-        with open(csv_output_path, 'w', encoding='utf-8', newline='') as f:
-            fieldnames = ['story_filename', 'story_title', 'word', 'word_finnish', 'issue_type', 
-                         'phrase_number', 'phrase_spanish', 'phrase_finnish', 'phrase_english']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_data)
+    csv_rows = generate_csv_report(stories, raw_results["crossref"])
+    first_row = next(csv_rows, None)
+    
+    if first_row is not None:
+        if gzip_csv:
+            # Level 1 keeps compression cheap while far fewer bytes reach disk.
+            csv_output_path = REPORTS_DIR / "v4-data-consistency-issues.csv.gz"
+            csv_file = gzip.open(csv_output_path, 'wt', compresslevel=1, encoding='utf-8', newline='')
+        else:
+            csv_output_path = REPORTS_DIR / "v4-data-consistency-issues.csv"
+            csv_file = open(csv_output_path, 'w', buffering=_CSV_BUFFER_SIZE, encoding='utf-8', newline='')
+        with csv_file as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerow(first_row)
+            issue_count = 1
+            for row in csv_rows:
+                writer.writerow(row)
+                issue_count += 1
         
         print(f"✅ CSV report generated: {csv_output_path}")
-        print(f"   Total issues: {len(csv_data)}")
+        print(f"   Total issues: {issue_count}")
     else:
         print("⚠️  No CSV data to generate (no cross-reference issues found)")
     
@@ -757,4 +935,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description='Generate the V4 data consistency report from validation results.'
+    )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Write the issues CSV gzip-compressed (v4-data-consistency-issues.csv.gz)'
+    )
+    
+    args = parser.parse_args()
+    main(gzip_csv=args.gzip)
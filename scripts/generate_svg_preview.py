@@ -8,8 +8,15 @@ Output: ../svg_preview.html (gitignored)
 
 import json
 import os
+from html import escape
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -20,8 +27,8 @@ OUTPUT_HTML = PROJECT_ROOT / "svg_preview.html"
 
 def load_phrase_mapping():
     """Load the JSON and build a mapping from SVG filename to phrase info."""
-    with open(JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    raw = JSON_PATH.read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
     
     # Map: svg_filename -> {spanish, english, finnish, context/category}
     mapping = {}
@@ -82,9 +89,11 @@ def get_all_svg_files():
     return sorted(files, key=sort_key)
 
 
-def generate_html(svg_files, phrase_mapping):
-    """Generate the HTML preview page."""
-    
+def generate_html(svg_files, phrase_mapping, with_phrases):
+    """Generate the HTML preview page.
+
+    with_phrases is the number of svg_files that have a phrase mapping.
+    """
     html_parts = ['''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -200,16 +209,18 @@ def generate_html(svg_files, phrase_mapping):
     <h1>🐷 Peppa Advanced Spanish - SVG Preview</h1>
     <div class="stats">
         Total SVG files: ''' + str(len(svg_files)) + ''' | 
-        With phrases: ''' + str(sum(1 for f in svg_files if f.name in phrase_mapping)) + ''' |
-        Missing phrases: ''' + str(sum(1 for f in svg_files if f.name not in phrase_mapping)) + '''
+        With phrases: ''' + str(with_phrases) + ''' |
+        Missing phrases: ''' + str(len(svg_files) - with_phrases) + '''
     </div>
     <div class="grid">
 ''']
     
     for svg_path in svg_files:
-        filename = svg_path.name
-        rel_path = svg_path.relative_to(PROJECT_ROOT)
-        phrase_info = phrase_mapping.get(filename, None)
+        # Escape everything interpolated into the page; phrases and
+        # category names may contain &, < or quotes.
+        filename = escape(svg_path.name)
+        rel_path = escape(str(svg_path.relative_to(PROJECT_ROOT)))
+        phrase_info = phrase_mapping.get(svg_path.name, None)
         
         card_class = "card" if phrase_info else "card missing"
         
@@ -222,10 +233,10 @@ def generate_html(svg_files, phrase_mapping):
 ''')
         
         if phrase_info:
-            spanish = phrase_info["spanish"]
-            english = phrase_info["english"]
-            finnish = phrase_info["finnish"]
-            category = phrase_info["category"]
+            spanish = escape(phrase_info["spanish"], quote=False)
+            english = escape(phrase_info["english"], quote=False)
+            finnish = escape(phrase_info["finnish"], quote=False)
+            category = escape(phrase_info["category"], quote=False)
             
             html_parts.append(f'''                <div class="spanish">{spanish}</div>
                 <div class="english">{english}</div>
@@ -257,16 +268,27 @@ def main():
     svg_files = get_all_svg_files()
     print(f"  Found {len(svg_files)} SVG files")
     
+    with_phrases = sum(1 for f in svg_files if f.name in phrase_mapping)
+    
     print("Generating HTML preview...")
-    html_content = generate_html(svg_files, phrase_mapping)
+    html_content = generate_html(svg_files, phrase_mapping, with_phrases)
     
-    with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # Leave an identical page untouched so its timestamp only changes when
+    # the preview does.
+    data = html_content.encode("utf-8")
+    try:
+        unchanged = OUTPUT_HTML.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
     
-    print(f"\n✓ Generated: {OUTPUT_HTML}")
+    if unchanged:
+        print(f"\n✓ Up to date: {OUTPUT_HTML}")
+    else:
+        OUTPUT_HTML.write_bytes(data)
+        print(f"\n✓ Generated: {OUTPUT_HTML}")
     print(f"  - Total SVGs: {len(svg_files)}")
-    print(f"  - With phrases: {sum(1 for f in svg_files if f.name in phrase_mapping)}")
-    print(f"  - Missing phrases: {sum(1 for f in svg_files if f.name not in phrase_mapping)}")
+    print(f"  - With phrases: {with_phrases}")
+    print(f"  - Missing phrases: {len(svg_files) - with_phrases}")
 
 
 if __name__ == "__main__":
@@ -57,6 +57,14 @@ class SVGFixer:
         '\x0f': '',     # Shift in
     }
     
+    # Control characters reported as errors (all below 0x20 except tab,
+    # newline and carriage return), with their characters built once.
+    CONTROL_CHARS = tuple((code, chr(code)) for code in range(0x20) if code not in (0x09, 0x0a, 0x0d))
+    
+    # Attribute values checked for unescaped &, and the entities allowed there
+    ATTR_VALUE_RE = re.compile(r'(?:aria-label|title)="([^"]*)"')
+    ENTITY_RE = re.compile(r'&(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);')
+    
     def __init__(self, svg_dir: str, fix: bool = False, verbose: bool = False):
         self.svg_dir = Path(svg_dir)
         self.fix = fix
@@ -85,10 +93,8 @@ class SVGFixer:
                 ))
             
             # Check for null bytes and other control characters
-            for char_code in range(0x20):
-                if char_code in [0x09, 0x0a, 0x0d]:  # Allow tab, newline, carriage return
-                    continue
-                if chr(char_code) in line:
+            for char_code, char in self.CONTROL_CHARS:
+                if char in line:
                     issues.append(SVGIssue(
                         'error',
                         'Control Character',
@@ -116,11 +122,11 @@ class SVGFixer:
             # Check for unescaped special XML characters in attribute values
             if 'aria-label=' in line or 'title=' in line:
                 # Extract attribute value
-                match = re.search(r'(?:aria-label|title)="([^"]*)"', line)
+                match = self.ATTR_VALUE_RE.search(line)
                 if match:
                     attr_value = match.group(1)
                     # Check for unescaped & that's not part of an entity
-                    if '&' in attr_value and not re.search(r'&(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);', attr_value):
+                    if '&' in attr_value and not self.ENTITY_RE.search(attr_value):
                         issues.append(SVGIssue(
                             'warning',
                             'Unescaped Character',
@@ -272,8 +278,9 @@ class SVGFixer:
             
             if fixed_content != content:
                 try:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(fixed_content)
+                    # Written as bytes so the LF endings fixed above are kept
+                    # on every platform.
+                    filepath.write_bytes(fixed_content.encode('utf-8'))
                     
                     for fix in fixes_applied:
                         issues.append(SVGIssue('info', 'Fixed', fix))
@@ -312,9 +319,9 @@ class SVGFixer:
     
     def print_report(self):
         """Print a summary report."""
-        print("\n" + "=" * 60)
-        print("REPORT")
-        print("=" * 60 + "\n")
+        # Collect the report and print it in one write instead of one
+        # print() per issue line.
+        lines = ["\n" + "=" * 60, "REPORT", "=" * 60 + "\n"]
         
         # Count issues by severity
         error_count = 0
@@ -325,7 +332,7 @@ class SVGFixer:
         for filename, issues in sorted(self.results.items()):
             if issues:
                 files_with_issues += 1
-                print(f"\n{filename}:")
+                lines.append(f"\n{filename}:")
                 for issue in issues:
                     if issue.severity == 'error':
                         error_count += 1
@@ -333,29 +340,32 @@ class SVGFixer:
                         warning_count += 1
                     elif issue.severity == 'info':
                         info_count += 1
-                    print(f"  {issue}")
+                    lines.append(f"  {issue}")
         
         # Summary
-        print("\n" + "=" * 60)
-        print("SUMMARY")
-        print("=" * 60)
-        print(f"Total files checked: {len(self.results)}")
-        print(f"Files with issues: {files_with_issues}")
-        print(f"Errors: {error_count}")
-        print(f"Warnings: {warning_count}")
+        lines.append("\n" + "=" * 60)
+        lines.append("SUMMARY")
+        lines.append("=" * 60)
+        lines.append(f"Total files checked: {len(self.results)}")
+        lines.append(f"Files with issues: {files_with_issues}")
+        lines.append(f"Errors: {error_count}")
+        lines.append(f"Warnings: {warning_count}")
         if self.fix:
-            print(f"Fixes applied: {info_count}")
-        print()
+            lines.append(f"Fixes applied: {info_count}")
+        lines.append("")
         
         if error_count > 0:
-            print("⚠️  Found errors that need attention!")
-            return 1
+            lines.append("⚠️  Found errors that need attention!")
+            status = 1
         elif warning_count > 0:
-            print("⚠️  Found warnings - consider reviewing")
-            return 0
+            lines.append("⚠️  Found warnings - consider reviewing")
+            status = 0
         else:
-            print("✓ All SVG files look good!")
-            return 0
+            lines.append("✓ All SVG files look good!")
+            status = 0
+        
+        print("\n".join(lines))
+        return status
 
 
 def main():